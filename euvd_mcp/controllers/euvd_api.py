@@ -6,18 +6,28 @@ Provides methods to query vulnerabilities, advisories, and related information.
 """
 
 import asyncio
+import functools
 import logging
+import random
+import ssl
+from collections.abc import AsyncIterator
+from importlib.util import find_spec
 from time import monotonic
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
+from urllib.parse import urlencode
 
 import httpx
-from cachetools import TTLCache
+import orjson
+from cachetools import LRUCache, TTLCache
 
 from euvd_mcp.models import (
     Advisory,
     ExploitedVulnerabilities,
     SearchResponse,
     Vulnerability,
+    normalize_search_body,
+    validate_many,
 )
 from euvd_mcp.utils.metrics import metrics
 from euvd_mcp.utils.settings import settings
@@ -26,6 +36,174 @@ logger = logging.getLogger(__name__)
 
 _RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
 
+# Every EUVD endpoint this manager calls; full URLs are built once per instance
+_ENDPOINTS = (
+    "/api/lastvulnerabilities",
+    "/api/exploitedvulnerabilities",
+    "/api/criticalvulnerabilities",
+    "/api/search",
+    "/api/enisaid",
+    "/api/advisory",
+)
+
+# (search_vulnerabilities argument, EUVD query parameter, optional transform)
+_SEARCH_PARAM_MAP: tuple[tuple[str, str, Callable[[Any], Any] | None], ...] = (
+    ("from_score", "fromScore", None),
+    ("to_score", "toScore", None),
+    ("from_epss", "fromEpss", None),
+    ("to_epss", "toEpss", None),
+    ("from_date", "fromDate", None),
+    ("to_date", "toDate", None),
+    ("from_updated_date", "fromUpdatedDate", None),
+    ("to_updated_date", "toUpdatedDate", None),
+    ("product", "product", None),
+    ("vendor", "vendor", None),
+    ("assigner", "assigner", None),
+    ("exploited", "exploited", lambda b: str(b).lower()),
+    ("text", "text", None),
+    ("page", "page", None),
+    ("size", "size", None),
+)
+
+
+_SEARCH_ARGUMENTS = frozenset(name for name, _, _ in _SEARCH_PARAM_MAP)
+
+
+def _search_params(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Map search_vulnerabilities arguments to EUVD query parameters.
+
+    Arguments that are missing or None are left out.
+    """
+    return {
+        api_name: transform(value) if transform else value
+        for name, api_name, transform in _SEARCH_PARAM_MAP
+        if (value := arguments.get(name)) is not None
+    }
+
+
+def _accept_encoding() -> str:
+    """Return an Accept-Encoding value listing only encodings httpx can decode.
+
+    httpx decodes brotli and zstd only when their optional packages are
+    installed; advertising them otherwise lets the server send a body the
+    client cannot read.
+    """
+    encodings = ["gzip", "deflate"]
+    if find_spec("brotli") or find_spec("brotlicffi"):
+        encodings.insert(0, "br")
+    if find_spec("zstandard"):
+        encodings.insert(0, "zstd")
+    return ", ".join(encodings)
+
+
+def _use_http2() -> bool:
+    """Return whether the client should negotiate HTTP/2.
+
+    ``httpx.AsyncClient(http2=True)`` raises ``ImportError`` when the h2
+    package is missing, so fall back to HTTP/1.1 instead of failing.
+    """
+    if not settings.euvd_http2:
+        return False
+    if find_spec("h2") is None:
+        logger.warning(
+            "EUVD_HTTP2 is enabled but the h2 package is not installed; "
+            "falling back to HTTP/1.1"
+        )
+        return False
+    return True
+
+
+# Computed once: installed decoders do not change while the process runs
+_ACCEPT_ENCODING = _accept_encoding()
+
+# Headers sent by every client; User-Agent is added from settings
+_DEFAULT_HEADERS = MappingProxyType(
+    {
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": _ACCEPT_ENCODING,
+        "Referer": "https://euvdservices.enisa.europa.eu/",
+        "Origin": "https://euvdservices.enisa.europa.eu",
+    }
+)
+
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """Return the TLS context shared by every manager's HTTP client.
+
+    Building a context loads the CA bundle, which costs more than the rest of
+    client construction; managers created per test or per tool reuse one.
+    """
+    return httpx.create_ssl_context()
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None = None) -> float:
+    """Return how long to wait before retry number ``attempt + 1``.
+
+    Honours a numeric ``Retry-After`` header when the server sends one;
+    otherwise uses exponential backoff with +/-50% jitter so that concurrent
+    callers do not retry in lockstep. Capped at ``settings.euvd_backoff_max``.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), settings.euvd_backoff_max)
+    delay = 2.0**attempt * random.uniform(0.5, 1.5)  # nosec B311 - not crypto
+    return min(delay, settings.euvd_backoff_max)
+
+
+def _cache_key(endpoint: str, params: dict[str, Any] | None = None) -> str:
+    """Return a cache key for an endpoint and its query parameters.
+
+    Parameters are sorted so that equivalent queries share one entry
+    regardless of keyword order.
+    """
+    if not params:
+        return endpoint
+    return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+
+def _build_vulnerabilities(items: Any, trusted: bool = False) -> list[Vulnerability]:
+    """Turn a list of vulnerability dicts into models.
+
+    With ``trusted`` the items are assumed to be well-formed and are built
+    with ``Vulnerability.from_trusted``: top-level fields are not type-checked,
+    while nested records are still built into their models. Otherwise the
+    whole list is validated in one call.
+    """
+    if trusted and isinstance(items, list):
+        return [Vulnerability.from_trusted(item) for item in items]
+    return validate_many(items)
+
+
+def _parse_search_response(data: Any, trusted: bool = False) -> SearchResponse:
+    """Validate an /api/search body, batching the vulnerability list.
+
+    Alternative field names are folded into ``content`` first; that list
+    alone is then validated in one ``TypeAdapter`` call, and the outer model
+    only checks the pagination fields and accepts the already built
+    instances. With ``trusted`` nothing is validated. ``data`` is not
+    mutated, as it may be shared with other callers through the in-flight
+    and ETag caches.
+    """
+    if not isinstance(data, dict):
+        return SearchResponse.model_validate(data)
+    data = normalize_search_body(data)
+    if isinstance(data.get("content"), list):
+        data["content"] = _build_vulnerabilities(data["content"], trusted)
+    if trusted:
+        return SearchResponse.from_trusted(data)
+    return SearchResponse.model_validate(data)
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    """Close ``client``, tolerating connections whose event loop has closed."""
+    try:
+        await client.aclose()
+    except (RuntimeError, OSError) as exc:
+        logger.debug("Replaced HTTP client did not close cleanly: %s", exc)
+
 
 class EUVDAPIManager:
     """
@@ -39,6 +217,8 @@ class EUVDAPIManager:
         timeout: int | None = None,
         max_retries: int | None = None,
         cache_ttl: int | None = None,
+        detail_cache_ttl: int | None = None,
+        trust_response: bool = False,
     ):
         """
         Initialize the EUVD API Manager.
@@ -51,9 +231,18 @@ class EUVDAPIManager:
             Maximum number of retries for failed requests (default: from settings or 3)
         cache_ttl : int | None
             TTL in seconds for cached responses (default: from settings or 30)
+        detail_cache_ttl : int | None
+            TTL in seconds for cached lookups by ID (default: from settings or 3600)
+        trust_response : bool
+            Build list and search responses with ``model_construct`` instead
+            of validating them (default: False). Faster, but unsafe against
+            malformed upstream data: top-level fields are not type-checked.
+            Nested records are still validated into their models.
 
         """
         self._base_url = settings.euvd_base_url
+        self._trust_response = trust_response
+        self._urls = {endpoint: self._base_url + endpoint for endpoint in _ENDPOINTS}
         self._timeout = timeout if timeout is not None else settings.euvd_timeout
         self._max_retries = (
             max_retries if max_retries is not None else settings.euvd_max_retries
@@ -62,33 +251,101 @@ class EUVDAPIManager:
         self._cache: TTLCache[str, Any] = TTLCache(
             maxsize=settings.cache_max_size, ttl=self._cache_ttl
         )
+        self._detail_cache_ttl = (
+            detail_cache_ttl
+            if detail_cache_ttl is not None
+            else settings.detail_cache_ttl
+        )
+        # Per-ID records change rarely and are re-queried often, so they get
+        # larger, longer-lived caches of their own.
+        self._vuln_cache: TTLCache[str, Vulnerability] = TTLCache(
+            maxsize=settings.detail_cache_max_size, ttl=self._detail_cache_ttl
+        )
+        self._adv_cache: TTLCache[str, Advisory] = TTLCache(
+            maxsize=settings.detail_cache_max_size, ttl=self._detail_cache_ttl
+        )
+        # Last ETag and decoded body per request, for If-None-Match revalidation
+        self._etags: LRUCache[str, tuple[str, Any]] = LRUCache(
+            maxsize=settings.cache_max_size
+        )
+        # Requests currently on the wire, keyed like the response cache
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
         self._client: httpx.AsyncClient | None = None
+        # Event loop the client's connections are bound to (None until known)
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # Close tasks for clients replaced after an event loop change
+        self._retiring: set[asyncio.Task[None]] = set()
         logger.debug(
-            "EUVDAPIManager initialised (timeout=%ds, max_retries=%d, cache_ttl=%ds)",
+            "EUVDAPIManager initialised (timeout=%ds, max_retries=%d, cache_ttl=%ds, "
+            "detail_cache_ttl=%ds)",
             self._timeout,
             self._max_retries,
             self._cache_ttl,
+            self._detail_cache_ttl,
         )
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Return the shared async HTTP client, creating it on first use."""
+        """Return the shared async HTTP client, creating it on first use.
+
+        The manager serves one event loop at a time, as FastMCP runs a single
+        loop; it is not thread-safe. An httpx client's pooled connections
+        belong to the event loop that opened them, so a client first used on
+        another loop (e.g. a previous ``asyncio.run`` call) is replaced
+        instead of reused.
+        """
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self._client is not None and self._client_loop is not loop:
+            if self._client_loop is None:
+                self._client_loop = loop
+            elif loop is not None:
+                logger.debug("Event loop changed; replacing HTTP client")
+                self._retire_client(self._client, loop)
+                self._client = None
+                self._inflight.clear()
         if self._client is None or self._client.is_closed:
+            self._client_loop = loop
+            http2 = _use_http2()
             self._client = httpx.AsyncClient(
-                headers={
-                    "User-Agent": settings.user_agent,
-                    "Accept": "application/json, text/plain, */*",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Referer": "https://euvdservices.enisa.europa.eu/",
-                    "Origin": "https://euvdservices.enisa.europa.eu",
-                },
+                headers={**_DEFAULT_HEADERS, "User-Agent": settings.user_agent},
                 timeout=self._timeout,
+                verify=_ssl_context(),
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.euvd_max_connections,
+                    max_keepalive_connections=settings.euvd_max_keepalive_connections,
+                    keepalive_expiry=settings.euvd_keepalive_expiry,
+                ),
+            )
+            logger.debug(
+                "HTTP client created (timeout=%ds, http2=%s, max_connections=%d, "
+                "keepalive=%d)",
+                self._timeout,
+                http2,
+                settings.euvd_max_connections,
+                settings.euvd_max_keepalive_connections,
             )
-            logger.debug("HTTP client created (timeout=%ds)", self._timeout)
         return self._client
 
-    def _cache_get(self, key: str) -> Any | None:
-        value = self._cache.get(key)
+    def _retire_client(
+        self, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Close a client replaced after an event loop change.
+
+        The previous loop has finished serving the manager, so the client is
+        closed from ``loop``; this empties its pool and releases the sockets
+        now rather than whenever the client is garbage collected.
+        """
+        task = loop.create_task(_aclose_quietly(client))
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    def _cache_get(
+        self, key: str, cache: TTLCache[str, Any] | None = None
+    ) -> Any | None:
+        value = (self._cache if cache is None else cache).get(key)
         if value is not None:
             logger.debug("Cache hit: %s", key)
             metrics.record_cache_hit()
@@ -97,28 +354,49 @@ class EUVDAPIManager:
         metrics.record_cache_miss()
         return None
 
-    def _cache_set(self, key: str, value: Any) -> None:
-        self._cache[key] = value
-        logger.debug("Cache set: %s (ttl=%ds)", key, self._cache_ttl)
+    def _cache_set(
+        self, key: str, value: Any, cache: TTLCache[str, Any] | None = None
+    ) -> None:
+        cache = self._cache if cache is None else cache
+        cache[key] = value
+        logger.debug("Cache set: %s (ttl=%ds)", key, cache.ttl)
 
     async def check_connectivity(self, timeout: float = 5.0) -> bool:
-        """Probe the EUVD API with a short timeout. Returns True if reachable."""
+        """Probe the EUVD API with a short timeout. Returns True if reachable.
+
+        Uses the shared client so the connection opened by the probe stays in
+        the keep-alive pool and the first tool call skips the TLS handshake.
+        """
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                resp = await client.get(f"{self._base_url}/api/lastvulnerabilities")
-                return bool(resp.status_code < 500)
+            resp = await self._get_client().get(
+                self._urls["/api/lastvulnerabilities"], timeout=timeout
+            )
+            return bool(resp.status_code < 500)
         except Exception:
             return False
 
     async def _make_request(
-        self, endpoint: str, params: dict[str, Any] | None = None
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        store_etag: bool = True,
     ) -> Any:
         """
         Make a GET request to the EUVD API with automatic retries.
 
+        When a previous response for the same endpoint and parameters carried an
+        ETag, the request is made conditional and a ``304 Not Modified`` reply is
+        answered with the previously decoded body.
+
+        Concurrent calls for the same endpoint and parameters share a single
+        in-flight HTTP request; every caller receives its result or exception.
+
         Args:
             endpoint: API endpoint path (e.g., '/api/lastvulnerabilities')
             params: Optional query parameters
+            store_etag: Keep the decoded body for later revalidation when the
+                response carries an ETag (default: True)
 
         Returns
         -------
@@ -127,29 +405,63 @@ class EUVDAPIManager:
 
         Raises
         ------
+        orjson.JSONDecodeError
+            If the response body is not valid JSON
         httpx.HTTPStatusError
             If the request fails with a non-retryable HTTP error
         httpx.TransportError
             If the connection fails after all retries
 
         """
-        url = f"{self._base_url}{endpoint}"
+        key = _cache_key(endpoint, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(endpoint, params, key, store_etag))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._forget_inflight, key))
+        else:
+            logger.debug("Joining in-flight request: %s", key)
+        # shield: one caller being cancelled must not cancel the shared request
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled
+            task.exception()
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        etag_key: str,
+        store_etag: bool = True,
+    ) -> Any:
+        """Perform the GET with retries and ETag revalidation (see _make_request)."""
+        url = self._urls.get(endpoint) or f"{self._base_url}{endpoint}"
         client = self._get_client()
         start = monotonic()
+        validator = self._etags.get(etag_key)
+        headers = {"If-None-Match": validator[0]} if validator is not None else None
 
         logger.debug("→ GET %s params=%s", endpoint, params)
 
         for attempt in range(self._max_retries + 1):
             try:
-                response = await client.get(url, params=params)
+                response = await client.get(url, params=params, headers=headers)
+
+                if response.status_code == 304 and validator is not None:
+                    logger.debug("← 304 %s (not modified)", endpoint)
+                    return validator[1]
 
                 if (
                     response.status_code in _RETRYABLE_STATUSES
                     and attempt < self._max_retries
                 ):
-                    delay = 2**attempt
+                    delay = _retry_delay(attempt, response)
                     logger.warning(
-                        "Retryable HTTP %d from %s — attempt %d/%d, retrying in %ds",
+                        "Retryable HTTP %d from %s — attempt %d/%d, retrying in %.1fs",
                         response.status_code,
                         endpoint,
                         attempt + 1,
@@ -164,13 +476,22 @@ class EUVDAPIManager:
                 logger.debug(
                     "← %d %s in %.0fms", response.status_code, endpoint, elapsed_ms
                 )
-                return response.json()
+                # orjson parses the raw bytes directly, skipping the decode to str
+                data = orjson.loads(response.content)
+                etag = response.headers.get("ETag")
+                if etag:
+                    if store_etag:
+                        self._etags[etag_key] = (etag, data)
+                else:
+                    # A stale validator would revalidate against an old body
+                    self._etags.pop(etag_key, None)
+                return data
 
             except httpx.TransportError as exc:
                 if attempt < self._max_retries:
-                    delay = 2**attempt
+                    delay = _retry_delay(attempt)
                     logger.warning(
-                        "Transport error on %s — attempt %d/%d: %s, retrying in %ds",
+                        "Transport error on %s — attempt %d/%d: %s, retrying in %.1fs",
                         endpoint,
                         attempt + 1,
                         self._max_retries + 1,
@@ -193,6 +514,20 @@ class EUVDAPIManager:
         # Unreachable, but satisfies the type checker
         raise RuntimeError(f"Exhausted retries for {url}")  # pragma: no cover
 
+    async def _get_latest(self, endpoint: str) -> ExploitedVulnerabilities:
+        """Fetch one of the latest-N endpoints through the response cache."""
+        key = _cache_key(endpoint)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+        data = await self._make_request(endpoint)
+        # The list is already built; skip a second validation pass
+        result = ExploitedVulnerabilities.from_trusted(
+            _build_vulnerabilities(data, self._trust_response)
+        )
+        self._cache_set(key, result)
+        return result
+
     async def get_last_vulnerabilities(self) -> ExploitedVulnerabilities:
         """
         Get the latest vulnerabilities.
@@ -208,13 +543,7 @@ class EUVDAPIManager:
         >>> vulnerabilities = await api.get_last_vulnerabilities()
 
         """
-        cached = self._cache_get("last_vulnerabilities")
-        if cached is not None:
-            return cached  # type: ignore[no-any-return]
-        data = await self._make_request("/api/lastvulnerabilities")
-        result = ExploitedVulnerabilities(list=data)
-        self._cache_set("last_vulnerabilities", result)
-        return result
+        return await self._get_latest("/api/lastvulnerabilities")
 
     async def get_exploited_vulnerabilities(self) -> ExploitedVulnerabilities:
         """
@@ -231,13 +560,7 @@ class EUVDAPIManager:
         >>> exploited = await api.get_exploited_vulnerabilities()
 
         """
-        cached = self._cache_get("exploited_vulnerabilities")
-        if cached is not None:
-            return cached  # type: ignore[no-any-return]
-        data = await self._make_request("/api/exploitedvulnerabilities")
-        result = ExploitedVulnerabilities(list=data)
-        self._cache_set("exploited_vulnerabilities", result)
-        return result
+        return await self._get_latest("/api/exploitedvulnerabilities")
 
     async def get_critical_vulnerabilities(self) -> ExploitedVulnerabilities:
         """
@@ -254,15 +577,9 @@ class EUVDAPIManager:
         >>> critical = await api.get_critical_vulnerabilities()
 
         """
-        cached = self._cache_get("critical_vulnerabilities")
-        if cached is not None:
-            return cached  # type: ignore[no-any-return]
-        data = await self._make_request("/api/criticalvulnerabilities")
-        result = ExploitedVulnerabilities(list=data)
-        self._cache_set("critical_vulnerabilities", result)
-        return result
+        return await self._get_latest("/api/criticalvulnerabilities")
 
-    async def search_vulnerabilities(  # noqa: C901
+    async def search_vulnerabilities(
         self,
         from_score: float | None = None,
         to_score: float | None = None,
@@ -315,43 +632,99 @@ class EUVDAPIManager:
             ... )
 
         """
-        params: dict[str, Any] = {}
-
-        if from_score is not None:
-            params["fromScore"] = from_score
-        if to_score is not None:
-            params["toScore"] = to_score
-        if from_epss is not None:
-            params["fromEpss"] = from_epss
-        if to_epss is not None:
-            params["toEpss"] = to_epss
-        if from_date is not None:
-            params["fromDate"] = from_date
-        if to_date is not None:
-            params["toDate"] = to_date
-        if from_updated_date is not None:
-            params["fromUpdatedDate"] = from_updated_date
-        if to_updated_date is not None:
-            params["toUpdatedDate"] = to_updated_date
-        if product is not None:
-            params["product"] = product
-        if vendor is not None:
-            params["vendor"] = vendor
-        if assigner is not None:
-            params["assigner"] = assigner
-        if exploited is not None:
-            params["exploited"] = str(exploited).lower()
-        if text is not None:
-            params["text"] = text
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
+        return await self._search(_search_params(locals()))
 
+    async def _search(self, params: dict[str, Any]) -> SearchResponse:
+        """Run a search with already mapped EUVD query parameters."""
+        key = _cache_key("/api/search", params)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
         data = await self._make_request(
             "/api/search", params=params if params else None
         )
-        return SearchResponse.model_validate(data)
+        result = _parse_search_response(data, self._trust_response)
+        self._cache_set(key, result)
+        return result
+
+    async def search_vulnerabilities_pages(
+        self, *, pages: range, **filters: Any
+    ) -> list[SearchResponse]:
+        """
+        Fetch several result pages of the same search concurrently.
+
+        Args:
+            pages: Page numbers to fetch (e.g., range(0, 5))
+            **filters: Any search_vulnerabilities keyword argument except page
+
+        Returns
+        -------
+        list[SearchResponse]
+            One response per requested page, in the order of ``pages``
+
+        Example
+            >>> api = EUVDAPIManager()
+            >>> results = await api.search_vulnerabilities_pages(
+            ...     pages=range(0, 3), vendor="Microsoft", size=100
+            ... )
+
+        """
+        logger.debug("Fetching %d search pages concurrently", len(pages))
+        return list(
+            await asyncio.gather(
+                *(self.search_vulnerabilities(page=page, **filters) for page in pages)
+            )
+        )
+
+    async def search_vulnerabilities_iter(
+        self, *, page_size: int = 100, **filters: Any
+    ) -> AsyncIterator[Vulnerability]:
+        """
+        Iterate over every result of a search, fetching pages on demand.
+
+        Only one page is held at a time, so memory stays bounded by
+        ``page_size`` however many results match: pages are not written to
+        the response cache, and their bodies are not kept for ETag
+        revalidation.
+
+        Args:
+            page_size: Results per request (1-100, default 100)
+            **filters: Any search_vulnerabilities keyword argument except
+                page and size
+
+        Returns
+        -------
+        AsyncIterator[Vulnerability]
+            Matching vulnerabilities in upstream order
+
+        Example
+            >>> api = EUVDAPIManager()
+            >>> async for vuln in api.search_vulnerabilities_iter(vendor="Cisco"):
+            ...     print(vuln.id)
+
+        """
+        unknown = filters.keys() - (_SEARCH_ARGUMENTS - {"page", "size"})
+        if unknown:
+            raise TypeError(f"Unexpected search filters: {sorted(unknown)}")
+        # Same bounds as SearchVulnerabilitiesInput.size: outside them the
+        # totals-based page count can loop forever or stop early
+        if not 1 <= page_size <= 100:
+            raise ValueError(f"page_size must be between 1 and 100, got {page_size}")
+        # Map the filters once; only page and size change between requests
+        base_params = _search_params(filters)
+        page = 0
+        while True:
+            data = await self._make_request(
+                "/api/search",
+                params={**base_params, "page": page, "size": page_size},
+                store_etag=False,
+            )
+            response = _parse_search_response(data, self._trust_response)
+            for vuln in response:
+                yield vuln
+            if not len(response) or not response.has_next_page(page, page_size):
+                return
+            page += 1
 
     async def get_vulnerability_by_id(self, enisa_id: str) -> Vulnerability:
         """
@@ -370,9 +743,14 @@ class EUVDAPIManager:
             >>> vuln = await api.get_vulnerability_by_id("EUVD-2024-45012")
 
         """
+        cached = self._cache_get(enisa_id, self._vuln_cache)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
         params = {"id": enisa_id}
         data = await self._make_request("/api/enisaid", params=params)
-        return Vulnerability.model_validate(data)
+        result = Vulnerability.model_validate(data)
+        self._cache_set(enisa_id, result, self._vuln_cache)
+        return result
 
     async def get_advisory_by_id(self, advisory_id: str) -> Advisory:
         """
@@ -391,16 +769,28 @@ class EUVDAPIManager:
             >>> advisory = await api.get_advisory_by_id("cisco-sa-ata19x-multi-RDTEqRsy")
 
         """
+        cached = self._cache_get(advisory_id, self._adv_cache)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
         params = {"id": advisory_id}
         data = await self._make_request("/api/advisory", params=params)
-        return Advisory.model_validate(data)
+        result = Advisory.model_validate(data)
+        self._cache_set(advisory_id, result, self._adv_cache)
+        return result
 
     async def close(self) -> None:
-        """Close the HTTP client and release resources."""
+        """Close the HTTP client and release resources.
+
+        Cached responses and ETag validators are dropped too, so a manager
+        reused after closing starts from fresh upstream data.
+        """
+        for cache in (self._cache, self._vuln_cache, self._adv_cache, self._etags):
+            cache.clear()
         if self._client is not None and not self._client.is_closed:
             await self._client.aclose()
             logger.debug("HTTP client closed")
         self._client = None
+        self._client_loop = None
 
     async def __aenter__(self) -> "EUVDAPIManager":
         """Async context manager entry."""
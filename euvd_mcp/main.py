@@ -11,9 +11,11 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _pkg_version
+from importlib.util import find_spec
 from time import monotonic
 from typing import Any, Callable
 
+import anyio
 import httpx
 from fastmcp import FastMCP
 from pydantic import ValidationError
@@ -24,6 +26,9 @@ from euvd_mcp.controllers.euvd_api import EUVDAPIManager
 from euvd_mcp.models import (
     GetAdvisoryByIdInput,
     GetVulnerabilityByIdInput,
+    PageRangeInput,
+    SearchCursor,
+    SearchCursorInput,
     SearchVulnerabilitiesInput,
 )
 from euvd_mcp.utils.logging_config import configure_logging
@@ -126,8 +131,16 @@ def _http_error_detail(status: int) -> str:
     return messages.get(status, f"The EUVD API returned HTTP {status}.")
 
 
-# Initialize API manager (shared across all tool calls)
-api_manager = EUVDAPIManager()
+@functools.cache
+def get_api() -> EUVDAPIManager:
+    """Return the API manager shared across all tool calls.
+
+    Created lazily on first use rather than at import time. Being a process-wide
+    singleton, its HTTP client and keep-alive connection pool persist across
+    tool invocations for the lifetime of the server. Tests can swap it out with
+    ``monkeypatch.setattr("euvd_mcp.main.get_api", ...)``.
+    """
+    return EUVDAPIManager()
 
 
 @asynccontextmanager
@@ -138,7 +151,7 @@ async def lifespan(app: FastMCP) -> AsyncGenerator[None, None]:
         _APP_VERSION,
         settings.log_level,
     )
-    async with api_manager:
+    async with get_api() as api_manager:
         reachable = await api_manager.check_connectivity()
         if reachable:
             logger.info(
@@ -215,7 +228,7 @@ async def get_last_vulnerabilities() -> dict[str, Any]:
     threats, or get_critical_vulnerabilities when they want the most severe ones.
     """
     logger.info("tool=get_last_vulnerabilities")
-    response = await api_manager.get_last_vulnerabilities()
+    response = await get_api().get_last_vulnerabilities()
     return response.model_dump(mode="json")
 
 
@@ -237,7 +250,7 @@ async def get_exploited_vulnerabilities() -> dict[str, Any]:
     products, vendors, or date ranges.
     """
     logger.info("tool=get_exploited_vulnerabilities")
-    response = await api_manager.get_exploited_vulnerabilities()
+    response = await get_api().get_exploited_vulnerabilities()
     return response.model_dump(mode="json")
 
 
@@ -259,7 +272,7 @@ async def get_critical_vulnerabilities() -> dict[str, Any]:
     the priority, or search_vulnerabilities to narrow results by product or vendor.
     """
     logger.info("tool=get_critical_vulnerabilities")
-    response = await api_manager.get_critical_vulnerabilities()
+    response = await get_api().get_critical_vulnerabilities()
     return response.model_dump(mode="json")
 
 
@@ -341,12 +354,184 @@ async def search_vulnerabilities(
     logger.info(
         "tool=search_vulnerabilities params=%s", params.model_dump(exclude_none=True)
     )
-    response = await api_manager.search_vulnerabilities(
+    response = await get_api().search_vulnerabilities(
         **params.model_dump(exclude_none=True)
     )
     return response.model_dump(mode="json")
 
 
+@mcp.tool()
+@_handle_tool_errors
+async def search_vulnerabilities_bulk(
+    from_page: int,
+    to_page: int,
+    from_score: float | None = None,
+    to_score: float | None = None,
+    from_epss: float | None = None,
+    to_epss: float | None = None,
+    from_date: str | None = None,
+    to_date: str | None = None,
+    from_updated_date: str | None = None,
+    to_updated_date: str | None = None,
+    product: str | None = None,
+    vendor: str | None = None,
+    assigner: str | None = None,
+    exploited: bool | None = None,
+    text: str | None = None,
+    size: int | None = None,
+) -> dict[str, Any]:
+    """Fetch a range of search result pages in one call and merge their records.
+
+    Accepts the same filters as search_vulnerabilities, but instead of a single
+    page it fetches every page from from_page to to_page (inclusive, at most 10
+    pages) concurrently and returns all matching records in one merged list.
+
+    Use this tool when the user needs more results than fit in one page, e.g.
+    "list all exploited Microsoft vulnerabilities from this year". Prefer
+    search_vulnerabilities when a single page is enough.
+
+    Args:
+        from_page: First zero-based page to fetch.
+        to_page: Last zero-based page to fetch (inclusive). At most 10 pages
+            can be requested per call.
+        from_score: Minimum CVSS base score (0.0–10.0).
+        to_score: Maximum CVSS base score (0.0–10.0).
+        from_epss: Minimum EPSS score (0.0–100.0).
+        to_epss: Maximum EPSS score (0.0–100.0).
+        from_date: Earliest publication date (YYYY-MM-DD).
+        to_date: Latest publication date (YYYY-MM-DD).
+        from_updated_date: Earliest last-updated date (YYYY-MM-DD).
+        to_updated_date: Latest last-updated date (YYYY-MM-DD).
+        product: Filter by affected product name (e.g. 'Windows').
+        vendor: Filter by vendor/manufacturer name (e.g. 'Microsoft').
+        assigner: Filter by the CVE numbering authority (e.g. 'mitre').
+        exploited: Set True for exploited-only, False to exclude exploited.
+        text: Free-text keyword search across descriptions and identifiers.
+        size: Number of results per page, between 1 and 100 (default 10).
+    """
+    page_range = PageRangeInput(from_page=from_page, to_page=to_page)
+    params = SearchVulnerabilitiesInput(
+        from_score=from_score,
+        to_score=to_score,
+        from_epss=from_epss,
+        to_epss=to_epss,
+        from_date=from_date,
+        to_date=to_date,
+        from_updated_date=from_updated_date,
+        to_updated_date=to_updated_date,
+        product=product,
+        vendor=vendor,
+        assigner=assigner,
+        exploited=exploited,
+        text=text,
+        page=None,
+        size=size,
+    )
+    filters = params.model_dump(exclude_none=True)
+    logger.info(
+        "tool=search_vulnerabilities_bulk pages=%d..%d params=%s",
+        page_range.from_page,
+        page_range.to_page,
+        filters,
+    )
+    responses = await get_api().search_vulnerabilities_pages(
+        pages=page_range.pages, **filters
+    )
+    first = responses[0]
+    return {
+        "content": [
+            vuln.model_dump(mode="json") for response in responses for vuln in response
+        ],
+        "total_elements": first.total_elements,
+        "total_pages": first.total_pages,
+        "from_page": page_range.from_page,
+        "to_page": page_range.to_page,
+    }
+
+
+@mcp.tool()
+@_handle_tool_errors
+async def search_vulnerabilities_cursor(
+    cursor: str | None = None,
+    from_score: float | None = None,
+    to_score: float | None = None,
+    from_epss: float | None = None,
+    to_epss: float | None = None,
+    from_date: str | None = None,
+    to_date: str | None = None,
+    from_updated_date: str | None = None,
+    to_updated_date: str | None = None,
+    product: str | None = None,
+    vendor: str | None = None,
+    assigner: str | None = None,
+    exploited: bool | None = None,
+    text: str | None = None,
+    size: int | None = None,
+) -> dict[str, Any]:
+    """Page through search results with an opaque cursor instead of page numbers.
+
+    Accepts the same filters as search_vulnerabilities. The first call passes
+    the filters and no cursor; each response includes next_cursor, which is
+    passed back unchanged to fetch the following page. next_cursor is null
+    once the last page has been returned.
+
+    Use this tool when walking through many pages of the same search; the
+    cursor carries the filters, so they cannot drift between calls.
+
+    Args:
+        cursor: next_cursor from a previous call. When given, all other
+            arguments are ignored in favour of the filters stored in it.
+        from_score: Minimum CVSS base score (0.0–10.0).
+        to_score: Maximum CVSS base score (0.0–10.0).
+        from_epss: Minimum EPSS score (0.0–100.0).
+        to_epss: Maximum EPSS score (0.0–100.0).
+        from_date: Earliest publication date (YYYY-MM-DD).
+        to_date: Latest publication date (YYYY-MM-DD).
+        from_updated_date: Earliest last-updated date (YYYY-MM-DD).
+        to_updated_date: Latest last-updated date (YYYY-MM-DD).
+        product: Filter by affected product name (e.g. 'Windows').
+        vendor: Filter by vendor/manufacturer name (e.g. 'Microsoft').
+        assigner: Filter by the CVE numbering authority (e.g. 'mitre').
+        exploited: Set True for exploited-only, False to exclude exploited.
+        text: Free-text keyword search across descriptions and identifiers.
+        size: Number of results per page, between 1 and 100 (default 10).
+    """
+    state = SearchCursorInput.model_validate({"cursor": cursor}).cursor
+    if state is None:
+        state = SearchCursor(
+            filters=SearchVulnerabilitiesInput(
+                from_score=from_score,
+                to_score=to_score,
+                from_epss=from_epss,
+                to_epss=to_epss,
+                from_date=from_date,
+                to_date=to_date,
+                from_updated_date=from_updated_date,
+                to_updated_date=to_updated_date,
+                product=product,
+                vendor=vendor,
+                assigner=assigner,
+                exploited=exploited,
+                text=text,
+                page=None,
+                size=size,
+            ),
+            page=0,
+        )
+    filters = state.filters.model_dump(exclude_none=True, exclude={"page"})
+    logger.info(
+        "tool=search_vulnerabilities_cursor page=%d params=%s", state.page, filters
+    )
+    response = await get_api().search_vulnerabilities(page=state.page, **filters)
+    has_next = response.has_next_page(state.page, filters.get("size", 10))
+    next_page = state.model_copy(update={"page": state.page + 1})
+    return {
+        "content": [vuln.model_dump(mode="json") for vuln in response],
+        "total_elements": response.total_elements,
+        "next_cursor": next_page.encode() if has_next else None,
+    }
+
+
 @mcp.tool()
 @_handle_tool_errors
 async def get_vulnerability_by_id(enisa_id: str) -> dict[str, Any]:
@@ -367,7 +552,7 @@ async def get_vulnerability_by_id(enisa_id: str) -> dict[str, Any]:
     """
     validated = GetVulnerabilityByIdInput(enisa_id=enisa_id)
     logger.info("tool=get_vulnerability_by_id enisa_id=%s", validated.enisa_id)
-    vulnerability = await api_manager.get_vulnerability_by_id(validated.enisa_id)
+    vulnerability = await get_api().get_vulnerability_by_id(validated.enisa_id)
     return vulnerability.model_dump(mode="json")
 
 
@@ -396,7 +581,7 @@ async def get_advisory_by_id(advisory_id: str) -> dict[str, Any]:
     """
     validated = GetAdvisoryByIdInput(advisory_id=advisory_id)
     logger.info("tool=get_advisory_by_id advisory_id=%s", validated.advisory_id)
-    advisory = await api_manager.get_advisory_by_id(validated.advisory_id)
+    advisory = await get_api().get_advisory_by_id(validated.advisory_id)
     return advisory.model_dump(mode="json")
 
 
@@ -409,8 +594,14 @@ if __name__ == "__main__":
         logger.info(
             "Starting in stdio transport mode — /health and /metrics are unavailable"
         )
-        mcp.run(transport="stdio")
+        # mcp.run() always uses the default asyncio loop; run it ourselves
+        # so anyio can pick uvloop when it is installed
+        anyio.run(
+            functools.partial(mcp.run_async, transport="stdio"),
+            backend_options={"use_uvloop": find_spec("uvloop") is not None},
+        )
     else:
         import uvicorn
 
+        # uvicorn already runs on uvloop when installed (uvicorn[standard])
         uvicorn.run(app, host=settings.host, port=settings.port)
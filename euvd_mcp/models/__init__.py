@@ -3,14 +3,21 @@
 from .input_models import (
     GetAdvisoryByIdInput,
     GetVulnerabilityByIdInput,
+    PageRangeInput,
+    SearchCursor,
+    SearchCursorInput,
     SearchVulnerabilitiesInput,
 )
 from .vulnerability import (
+    VULNERABILITY_LIST_ADAPTER,
     Advisory,
     ExploitedVulnerabilities,
     SearchResponse,
     Vulnerability,
     VulnerabilityListResponse,
+    normalize_search_body,
+    to_json_bytes,
+    validate_many,
 )
 
 __all__ = [
@@ -20,8 +27,15 @@ __all__ = [
     "ExploitedVulnerabilities",
     "SearchResponse",
     "Advisory",
+    "VULNERABILITY_LIST_ADAPTER",
+    "normalize_search_body",
+    "to_json_bytes",
+    "validate_many",
     # Input models
     "SearchVulnerabilitiesInput",
+    "PageRangeInput",
+    "SearchCursor",
+    "SearchCursorInput",
     "GetVulnerabilityByIdInput",
     "GetAdvisoryByIdInput",
 ]
@@ -5,14 +5,20 @@ Each model describes the accepted input for a specific tool and enforces
 all validation constraints through Pydantic field definitions and validators.
 """
 
+import base64
+import json
 import re
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 _ENISA_ID_RE = re.compile(r"^EUVD-\d{4}-\d+$")
 
+# Upper bound on pages fetched concurrently by a single bulk search call
+MAX_BULK_PAGES = 10
+
 
 def _validate_date_string(value: str, field_name: str) -> str:
     if not _DATE_RE.match(value):
@@ -76,6 +82,70 @@ class SearchVulnerabilitiesInput(BaseModel):
         return _validate_date_string(v, str(getattr(info, "field_name", "date")))
 
 
+class PageRangeInput(BaseModel):
+    """Input model for the page range of the search_vulnerabilities_bulk tool."""
+
+    from_page: int = Field(ge=0, description="First page to fetch (starts at 0)")
+    to_page: int = Field(ge=0, description="Last page to fetch (inclusive)")
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "PageRangeInput":
+        """Validate the range is ordered and no wider than MAX_BULK_PAGES."""
+        if self.to_page < self.from_page:
+            raise ValueError(
+                f"to_page must be >= from_page, got {self.from_page}..{self.to_page}"
+            )
+        if self.to_page - self.from_page + 1 > MAX_BULK_PAGES:
+            raise ValueError(
+                f"at most {MAX_BULK_PAGES} pages can be fetched at once, "
+                f"got {self.to_page - self.from_page + 1}"
+            )
+        return self
+
+    @property
+    def pages(self) -> range:
+        """Return the requested pages as a range."""
+        return range(self.from_page, self.to_page + 1)
+
+
+class SearchCursor(BaseModel):
+    """Continuation state for the search_vulnerabilities_cursor tool.
+
+    Serialised as URL-safe base64 JSON so that clients can treat it as an
+    opaque token. Decoding re-validates the filters, so a tampered cursor is
+    rejected like any other invalid input.
+    """
+
+    filters: SearchVulnerabilitiesInput = Field(
+        description="Search filters, excluding the page number"
+    )
+    page: int = Field(ge=0, description="Page to fetch next (starts at 0)")
+
+    def encode(self) -> str:
+        """Return the cursor as an opaque URL-safe token."""
+        payload = self.model_dump_json(exclude_none=True)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+class SearchCursorInput(BaseModel):
+    """Input model for the cursor of the search_vulnerabilities_cursor tool."""
+
+    cursor: SearchCursor | None = Field(
+        None, description="Token returned as next_cursor by a previous call"
+    )
+
+    @field_validator("cursor", mode="before")
+    @classmethod
+    def decode_cursor(cls, v: Any) -> Any:
+        """Decode an opaque cursor token into its JSON payload."""
+        if not isinstance(v, str):
+            return v
+        try:
+            return json.loads(base64.urlsafe_b64decode(v.encode()))
+        except ValueError:
+            raise ValueError("cursor is malformed; pass next_cursor unchanged")
+
+
 class GetVulnerabilityByIdInput(BaseModel):
     """Input model for the get_vulnerability_by_id tool."""
 
@@ -1,8 +1,9 @@
 """Pydantic models for EUVD vulnerability and advisory data."""
 
+from array import array
 from typing import Any, List
 
-from pydantic import BaseModel, Field, RootModel
+from pydantic import BaseModel, Field, RootModel, TypeAdapter, model_validator
 
 
 # Base models
@@ -191,6 +192,29 @@ class Vulnerability(BaseModel):
     # Allow additional fields that might be present in the API response
     model_config = {"extra": "allow", "populate_by_name": True}
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "Vulnerability":
+        """Build a vulnerability from a trusted record, skipping top-level checks.
+
+        Scalar fields are taken as-is. Nested records are still validated into
+        their models, so the result serialises without warnings and with the
+        same snake_case keys as a validated record.
+        """
+        data = dict(data)
+        for key, adapter in _NESTED_FIELD_ADAPTERS.items():
+            if data.get(key) is not None:
+                data[key] = adapter.validate_python(data[key])
+        return cls.model_construct(**data)
+
+
+# Nested record lists of Vulnerability, keyed by both alias and field name
+_NESTED_FIELD_ADAPTERS: dict[str, TypeAdapter[Any]] = {
+    key: TypeAdapter(field.annotation)
+    for name, field in Vulnerability.model_fields.items()
+    if name.startswith("enisa_id_")
+    for key in (name, field.alias or name)
+}
+
 
 class VulnerabilityListResponse(RootModel[List[Vulnerability]]):
     """
@@ -215,6 +239,28 @@ class VulnerabilityListResponse(RootModel[List[Vulnerability]]):
         return self.root
 
 
+def to_json_bytes(model: BaseModel, *, by_alias: bool = False) -> bytes:
+    """Serialise a model straight to JSON bytes in pydantic-core.
+
+    Prefer this over ``json.dumps(model.model_dump(mode="json"))``, which
+    converts every field to Python first, and over ``model_dump_json()``
+    when the caller needs bytes rather than ``str``.
+    """
+    return model.__pydantic_serializer__.to_json(model, by_alias=by_alias)
+
+
+# Validates a whole list of records through one compiled core schema; built
+# once per process and shared by the API manager and the tests
+VULNERABILITY_LIST_ADAPTER: TypeAdapter[list[Vulnerability]] = TypeAdapter(
+    list[Vulnerability]
+)
+
+
+def validate_many(items: Any) -> List[Vulnerability]:
+    """Validate a list of vulnerability records in a single core call."""
+    return VULNERABILITY_LIST_ADAPTER.validate_python(items)
+
+
 class ExploitedVulnerabilities(BaseModel):
     """Model representing a list of exploited vulnerabilities."""
 
@@ -222,25 +268,42 @@ class ExploitedVulnerabilities(BaseModel):
         ..., description="List of exploited vulnerabilities"
     )
 
+    @classmethod
+    def from_trusted(cls, items: List[Vulnerability]) -> "ExploitedVulnerabilities":
+        """Wrap already-built vulnerabilities without validating them again."""
+        return cls.model_construct(list=items)
+
+
+def normalize_search_body(data: Any) -> Any:
+    """Move 'data'/'vulnerabilities' to 'content' and 'total' to 'totalElements'.
+
+    An alternative list replaces 'content' when that is missing or empty.
+    Works on a copy: the input may be a response body shared with other
+    callers through the API manager's caches.
+    """
+    if not isinstance(data, dict):
+        return data
+    data = dict(data)
+    for name in ("data", "vulnerabilities"):
+        if not data.get("content") and data.get(name) is not None:
+            data["content"] = data.pop(name)
+    has_total = data.get("totalElements", data.get("total_elements")) is not None
+    if not has_total and data.get("total") is not None:
+        data["totalElements"] = data.pop("total")
+    return data
+
 
 class SearchResponse(BaseModel):
     """Model representing a search response with pagination."""
 
-    content: List[Vulnerability] | None = Field(
-        None, description="List of vulnerabilities in current page"
-    )
-    data: List[Vulnerability] | None = Field(
-        None, description="Alternative field name for content"
-    )
-    vulnerabilities: List[Vulnerability] | None = Field(
-        None, description="Alternative field name for content"
+    # Tuples: pages are never mutated after parsing, and pydantic-core builds
+    # an exact-size tuple straight from the validated items.
+    content: tuple[Vulnerability, ...] | None = Field(
+        None, description="Vulnerabilities in current page"
     )
     total_elements: int | None = Field(
         None, alias="totalElements", description="Total number of elements"
     )
-    total: int | None = Field(
-        None, description="Total number of elements (alternative)"
-    )
     total_pages: int | None = Field(
         None, alias="totalPages", description="Total number of pages"
     )
@@ -249,15 +312,58 @@ class SearchResponse(BaseModel):
     # Allow additional fields
     model_config = {"extra": "allow", "populate_by_name": True}
 
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_alternatives(cls, data: Any) -> Any:
+        """Fold the alternative result and total keys into content/totalElements."""
+        return normalize_search_body(data)
+
     def __iter__(self) -> Any:
         """Allow iteration over vulnerabilities."""
-        vulns = self.content or self.data or self.vulnerabilities or []
-        return iter(vulns)
+        return iter(self.content or ())
 
     def __len__(self) -> int:
         """Return the number of vulnerabilities in current page."""
-        vulns = self.content or self.data or self.vulnerabilities or []
-        return len(vulns)
+        return len(self.content or ())
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "SearchResponse":
+        """Build a response from trusted data without validating it.
+
+        The result list must already hold ``Vulnerability`` instances; keys
+        may use either the API aliases or the field names. The list is
+        converted to a tuple to match validated responses.
+        """
+        data = normalize_search_body(data)
+        if isinstance(data.get("content"), list):
+            data["content"] = tuple(data["content"])
+        return cls.model_construct(**data)
+
+    def to_arrays(self) -> dict[str, Any]:
+        """Return the page as columns for vectorised numeric filtering.
+
+        ``base_score`` and ``epss`` are packed ``array('d')`` columns with NaN
+        for missing values, so they can be wrapped without copying by
+        ``numpy.frombuffer`` or ``memoryview``; ``id`` is a list of the same
+        length.
+        """
+        vulns = list(self)
+        nan = float("nan")
+        return {
+            "id": [v.id for v in vulns],
+            "base_score": array(
+                "d", [nan if v.base_score is None else v.base_score for v in vulns]
+            ),
+            "epss": array("d", [nan if v.epss is None else v.epss for v in vulns]),
+        }
+
+    def has_next_page(self, page: int, size: int) -> bool:
+        """Return whether results exist beyond ``page`` at ``size`` per page."""
+        if self.total_pages is not None:
+            return page + 1 < self.total_pages
+        if self.total_elements is not None:
+            return (page + 1) * size < self.total_elements
+        return len(self) >= size
 
 
 # Advisory-related models
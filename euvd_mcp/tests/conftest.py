@@ -4,11 +4,21 @@ Pytest configuration file.
 Defines fixtures and configuration for all tests.
 """
 
+import copy
 from pathlib import Path
 
 import pytest
 
+from euvd_mcp import main
 from euvd_mcp.controllers.euvd_api import EUVDAPIManager
+from euvd_mcp.models import Vulnerability
+
+
+def _frozen_payload(payload):
+    """Yield a session-wide payload and fail if any test mutated it."""
+    snapshot = copy.deepcopy(payload)
+    yield payload
+    assert payload == snapshot, "a test mutated a session-scoped sample payload"
 
 
 @pytest.fixture
@@ -23,71 +33,90 @@ def env_file_path(project_root):
     return project_root / ".env"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_vulnerability():
-    """Return a sample vulnerability response."""
-    return {
-        "id": "EUVD-2024-45012",
-        "enisaUuid": "uuid-12345",
-        "description": "Test vulnerability description",
-        "datePublished": "2024-01-01T00:00:00Z",
-        "dateUpdated": "2024-12-13T00:00:00Z",
-        "baseScore": 8.5,
-        "baseScoreVersion": "3.1",
-        "baseScoreVector": "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:N/A:N",
-        "references": "https://example.com/ref1\nhttps://example.com/ref2",
-        "aliases": "CVE-2024-12345",
-        "assigner": "mitre",
-        "epss": 45.5,
-        "enisaIdProduct": [],
-        "enisaIdVendor": [],
-        "enisaIdVulnerability": [],
-        "enisaIdAdvisory": [],
-    }
-
-
-@pytest.fixture
+    """Return a sample vulnerability response (shared; do not mutate)."""
+    yield from _frozen_payload(
+        {
+            "id": "EUVD-2024-45012",
+            "enisaUuid": "uuid-12345",
+            "description": "Test vulnerability description",
+            "datePublished": "2024-01-01T00:00:00Z",
+            "dateUpdated": "2024-12-13T00:00:00Z",
+            "baseScore": 8.5,
+            "baseScoreVersion": "3.1",
+            "baseScoreVector": "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:N/A:N",
+            "references": "https://example.com/ref1\nhttps://example.com/ref2",
+            "aliases": "CVE-2024-12345",
+            "assigner": "mitre",
+            "epss": 45.5,
+            "enisaIdProduct": [],
+            "enisaIdVendor": [],
+            "enisaIdVulnerability": [],
+            "enisaIdAdvisory": [],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def prevalidated_vuln(sample_vulnerability):
+    """Return sample_vulnerability as a validated model (shared; use model_copy)."""
+    yield from _frozen_payload(Vulnerability.model_validate(sample_vulnerability))
+
+
+@pytest.fixture(scope="session")
 def sample_vulnerabilities_list(sample_vulnerability):
-    """Return a sample list of vulnerabilities."""
+    """Return a sample list of vulnerabilities (shared; do not mutate)."""
     vuln1 = sample_vulnerability.copy()
     vuln2 = sample_vulnerability.copy()
     vuln2["id"] = "EUVD-2024-45013"
     vuln2["aliases"] = "CVE-2024-12346"
-    return [vuln1, vuln2]
+    yield from _frozen_payload([vuln1, vuln2])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_search_response(sample_vulnerabilities_list):
-    """Return a sample search response with pagination."""
-    return {
-        "content": sample_vulnerabilities_list,
-        "totalElements": 100,
-        "totalPages": 10,
-        "page": 0,
-        "size": 10,
-    }
-
-
-@pytest.fixture
+    """Return a sample search response with pagination (shared; do not mutate)."""
+    yield from _frozen_payload(
+        {
+            "content": sample_vulnerabilities_list,
+            "totalElements": 100,
+            "totalPages": 10,
+            "page": 0,
+            "size": 10,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_advisory():
-    """Return a sample advisory response."""
-    return {
-        "id": "cisco-sa-ata19x-multi-RDTEqRsy",
-        "description": "Test advisory description",
-        "summary": "Test summary",
-        "datePublished": "2024-01-01T00:00:00Z",
-        "dateUpdated": "2024-12-13T00:00:00Z",
-        "baseScore": 7.5,
-        "references": "https://example.com/adv1",
-        "aliases": "CVE-2024-12347",
-        "source": {"id": 1, "name": "Cisco"},
-        "advisoryProduct": [],
-        "enisaIdAdvisories": [],
-        "vulnerabilityAdvisory": [],
-    }
+    """Return a sample advisory response (shared; do not mutate)."""
+    yield from _frozen_payload(
+        {
+            "id": "cisco-sa-ata19x-multi-RDTEqRsy",
+            "description": "Test advisory description",
+            "summary": "Test summary",
+            "datePublished": "2024-01-01T00:00:00Z",
+            "dateUpdated": "2024-12-13T00:00:00Z",
+            "baseScore": 7.5,
+            "references": "https://example.com/adv1",
+            "aliases": "CVE-2024-12347",
+            "source": {"id": 1, "name": "Cisco"},
+            "advisoryProduct": [],
+            "enisaIdAdvisories": [],
+            "vulnerabilityAdvisory": [],
+        }
+    )
 
 
 @pytest.fixture
 def api_manager():
     """Return an API manager instance with retries disabled for unit tests."""
     return EUVDAPIManager(timeout=10, max_retries=0)
+
+
+@pytest.fixture
+def tool_api(api_manager, monkeypatch):
+    """Route the MCP tools in main.py to the unit-test API manager."""
+    monkeypatch.setattr(main, "get_api", lambda: api_manager)
+    return api_manager
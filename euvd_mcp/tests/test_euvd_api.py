@@ -2,11 +2,36 @@
 Unit tests for the EUVD API Manager.
 """
 
+import asyncio
+import copy
+import inspect
+import warnings
+
 import httpx
 import pytest
 
-from euvd_mcp.controllers.euvd_api import EUVDAPIManager
-from euvd_mcp.models import Advisory, SearchResponse, Vulnerability
+from euvd_mcp.controllers.euvd_api import (
+    _DEFAULT_HEADERS,
+    _ENDPOINTS,
+    _SEARCH_PARAM_MAP,
+    EUVDAPIManager,
+    _accept_encoding,
+    _build_vulnerabilities,
+    _cache_key,
+    _parse_search_response,
+    _retry_delay,
+    _ssl_context,
+)
+from euvd_mcp.models import (
+    Advisory,
+    ExploitedVulnerabilities,
+    SearchResponse,
+    Vulnerability,
+)
+from euvd_mcp.models.vulnerability import EnisaIdProduct
+from euvd_mcp.utils.settings import settings
+
+SEARCH_URL = f"{settings.euvd_base_url}/api/search"
 
 
 class TestEUVDAPIManagerInit:
@@ -33,6 +58,12 @@ class TestEUVDAPIManagerInit:
         manager = EUVDAPIManager(cache_ttl=60)
         assert manager._cache_ttl == 60
 
+    def test_api_manager_custom_detail_cache_ttl(self):
+        """Test initializing API manager with custom by-ID cache TTL."""
+        manager = EUVDAPIManager(detail_cache_ttl=120)
+        assert manager._vuln_cache.ttl == 120
+        assert manager._adv_cache.ttl == 120
+
     def test_get_client_creates_async_client(self):
         """Test that _get_client creates an httpx.AsyncClient."""
         manager = EUVDAPIManager()
@@ -44,6 +75,62 @@ class TestEUVDAPIManagerInit:
         manager = EUVDAPIManager()
         assert manager._get_client() is manager._get_client()
 
+    def test_get_client_binds_unbound_client_to_loop(self):
+        """Test that a client built outside a loop is kept on first async use."""
+        manager = EUVDAPIManager()
+        client = manager._get_client()
+
+        async def current_client():
+            return manager._get_client()
+
+        assert asyncio.run(current_client()) is client
+        assert manager._client_loop is not None
+        asyncio.run(manager.close())
+
+    def test_get_client_replaced_on_new_event_loop(self):
+        """Test that each event loop gets its own client."""
+        manager = EUVDAPIManager()
+
+        async def current_client():
+            return manager._get_client()
+
+        first = asyncio.run(current_client())
+        second = asyncio.run(current_client())
+        assert first is not second
+        asyncio.run(manager.close())
+
+    def test_replaced_client_closed_after_loop_closed(self):
+        """Test that a client from a finished event loop is closed on replacement."""
+        manager = EUVDAPIManager()
+
+        async def replace_client():
+            client = manager._get_client()
+            await asyncio.gather(*manager._retiring)
+            return client
+
+        first = asyncio.run(replace_client())
+        asyncio.run(replace_client())
+        assert first.is_closed
+        asyncio.run(manager.close())
+
+    def test_replaced_client_closed_when_loop_stopped(self):
+        """Test that a client from an open but idle loop is closed on replacement."""
+        manager = EUVDAPIManager()
+
+        async def current_client():
+            client = manager._get_client()
+            await asyncio.gather(*manager._retiring)
+            return client
+
+        old_loop = asyncio.new_event_loop()
+        try:
+            first = old_loop.run_until_complete(current_client())
+            asyncio.run(current_client())
+            assert first.is_closed
+        finally:
+            old_loop.close()
+        asyncio.run(manager.close())
+
     def test_client_headers_are_set(self):
         """Test that the HTTP client has the expected headers."""
         manager = EUVDAPIManager()
@@ -51,6 +138,89 @@ class TestEUVDAPIManagerInit:
         assert "User-Agent" in client.headers
         assert "Accept" in client.headers
 
+    def test_default_headers_are_read_only(self):
+        """Test that the shared header mapping cannot be modified."""
+        with pytest.raises(TypeError):
+            _DEFAULT_HEADERS["Accept"] = "text/html"
+
+
+class TestAcceptEncoding:
+    """Test the _accept_encoding helper."""
+
+    def test_advertises_installed_decoders(self, monkeypatch):
+        """Test that brotli and zstd are advertised when their packages exist."""
+        monkeypatch.setattr(
+            "euvd_mcp.controllers.euvd_api.find_spec", lambda name: object()
+        )
+        assert _accept_encoding() == "zstd, br, gzip, deflate"
+
+    def test_omits_missing_decoders(self, monkeypatch):
+        """Test that only gzip and deflate are advertised without extra decoders."""
+        monkeypatch.setattr(
+            "euvd_mcp.controllers.euvd_api.find_spec", lambda name: None
+        )
+        assert _accept_encoding() == "gzip, deflate"
+
+    def test_client_uses_helper(self):
+        """Test that the HTTP client sends the computed header."""
+        manager = EUVDAPIManager()
+        assert manager._get_client().headers["Accept-Encoding"] == _accept_encoding()
+
+
+class TestHTTP2:
+    """Test HTTP/2 selection for the shared client."""
+
+    def test_enabled_when_h2_installed(self, mocker):
+        """Test that the client negotiates HTTP/2 by default."""
+        client = mocker.spy(httpx, "AsyncClient")
+        EUVDAPIManager()._get_client()
+        assert client.call_args.kwargs["http2"] is True
+
+    def test_falls_back_without_h2(self, mocker, monkeypatch):
+        """Test that a missing h2 package downgrades to HTTP/1.1."""
+        monkeypatch.setattr(
+            "euvd_mcp.controllers.euvd_api.find_spec", lambda name: None
+        )
+        client = mocker.spy(httpx, "AsyncClient")
+        EUVDAPIManager()._get_client()
+        assert client.call_args.kwargs["http2"] is False
+
+
+class TestSharedClientResources:
+    """Test resources built once and shared by every manager."""
+
+    def test_ssl_context_built_once(self, mocker):
+        """Test that clients of different managers reuse one TLS context."""
+        _ssl_context.cache_clear()
+        spy = mocker.spy(httpx, "create_ssl_context")
+        try:
+            EUVDAPIManager()._get_client()
+            EUVDAPIManager()._get_client()
+            assert spy.call_count == 1
+        finally:
+            _ssl_context.cache_clear()
+
+
+class TestCheckConnectivity:
+    """Test the startup connectivity probe."""
+
+    async def test_check_connectivity_reachable(self, api_manager, httpx_mock):
+        """Test that a successful probe reports the API as reachable."""
+        httpx_mock.add_response(json=[])
+        assert await api_manager.check_connectivity() is True
+
+    async def test_check_connectivity_server_error(self, api_manager, httpx_mock):
+        """Test that a 5xx probe reports the API as unreachable."""
+        httpx_mock.add_response(status_code=503)
+        assert await api_manager.check_connectivity() is False
+
+    async def test_check_connectivity_uses_shared_client(self, api_manager, httpx_mock):
+        """Test that the probe warms the shared client instead of a throwaway one."""
+        httpx_mock.add_response(json=[])
+        await api_manager.check_connectivity()
+        assert api_manager._client is not None
+        assert not api_manager._client.is_closed
+
 
 class TestEUVDAPIManagerRequests:
     """Test API request methods."""
@@ -70,6 +240,12 @@ class TestEUVDAPIManagerRequests:
         sent = httpx_mock.get_requests()[0]
         assert "fromScore=7.5" in str(sent.url)
 
+    async def test_make_request_invalid_json(self, api_manager, httpx_mock):
+        """Test that a non-JSON body raises a decode error."""
+        httpx_mock.add_response(content=b"<html>maintenance</html>")
+        with pytest.raises(ValueError):
+            await api_manager._make_request("/api/test")
+
     async def test_make_request_transport_error(self, api_manager, httpx_mock):
         """Test that transport errors are raised after retries."""
         httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
@@ -83,6 +259,101 @@ class TestEUVDAPIManagerRequests:
             await api_manager._make_request("/api/test")
 
 
+class TestSingleFlight:
+    """Test deduplication of concurrent identical requests."""
+
+    async def test_concurrent_identical_requests_share_one_call(
+        self, api_manager, httpx_mock
+    ):
+        """Test that identical concurrent requests hit the network once."""
+        httpx_mock.add_response(json={"id": "EUVD-2024-45012"})
+        results = await asyncio.gather(
+            *(
+                api_manager._make_request("/api/enisaid", params={"id": "x"})
+                for _ in range(5)
+            )
+        )
+        assert all(r == {"id": "EUVD-2024-45012"} for r in results)
+        assert len(httpx_mock.get_requests()) == 1
+        assert api_manager._inflight == {}
+
+    async def test_distinct_requests_not_coalesced(self, api_manager, httpx_mock):
+        """Test that requests with different params are sent separately."""
+        httpx_mock.add_response(json={"id": "a"})
+        httpx_mock.add_response(json={"id": "b"})
+        await asyncio.gather(
+            api_manager._make_request("/api/enisaid", params={"id": "a"}),
+            api_manager._make_request("/api/enisaid", params={"id": "b"}),
+        )
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_error_propagates_to_every_waiter(self, api_manager, httpx_mock):
+        """Test that a shared failure is raised in every caller."""
+        httpx_mock.add_response(status_code=404)
+        results = await asyncio.gather(
+            api_manager._make_request("/api/test"),
+            api_manager._make_request("/api/test"),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_sequential_requests_not_coalesced(self, api_manager, httpx_mock):
+        """Test that a finished request is not reused by later calls."""
+        httpx_mock.add_response(json={"v": 1})
+        httpx_mock.add_response(json={"v": 2})
+        assert await api_manager._make_request("/api/test") == {"v": 1}
+        assert await api_manager._make_request("/api/test") == {"v": 2}
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation in _make_request."""
+
+    async def test_sends_if_none_match_after_etag(self, api_manager, httpx_mock):
+        """Test that a stored ETag is sent back on the next request."""
+        httpx_mock.add_response(json={"v": 1}, headers={"ETag": '"abc"'})
+        httpx_mock.add_response(json={"v": 1})
+        await api_manager._make_request("/api/test")
+        await api_manager._make_request("/api/test")
+        second = httpx_mock.get_requests()[1]
+        assert second.headers["If-None-Match"] == '"abc"'
+
+    async def test_not_modified_returns_stored_body(self, api_manager, httpx_mock):
+        """Test that a 304 reply is answered with the previously decoded body."""
+        httpx_mock.add_response(json={"v": 1}, headers={"ETag": '"abc"'})
+        httpx_mock.add_response(status_code=304)
+        first = await api_manager._make_request("/api/test")
+        second = await api_manager._make_request("/api/test")
+        assert second == first == {"v": 1}
+
+    async def test_etag_scoped_to_params(self, api_manager, httpx_mock):
+        """Test that an ETag is only reused for identical parameters."""
+        httpx_mock.add_response(json={"v": 1}, headers={"ETag": '"abc"'})
+        httpx_mock.add_response(json={"v": 2})
+        await api_manager._make_request("/api/search", params={"page": 0})
+        await api_manager._make_request("/api/search", params={"page": 1})
+        assert "If-None-Match" not in httpx_mock.get_requests()[1].headers
+
+    async def test_no_conditional_header_without_etag(self, api_manager, httpx_mock):
+        """Test that responses without an ETag are not revalidated."""
+        httpx_mock.add_response(json={"v": 1})
+        httpx_mock.add_response(json={"v": 1})
+        await api_manager._make_request("/api/test")
+        await api_manager._make_request("/api/test")
+        assert "If-None-Match" not in httpx_mock.get_requests()[1].headers
+
+    async def test_etag_dropped_when_response_has_none(self, api_manager, httpx_mock):
+        """Test that a 200 without an ETag forgets the stored validator."""
+        httpx_mock.add_response(json={"v": 1}, headers={"ETag": '"abc"'})
+        httpx_mock.add_response(json={"v": 2})
+        httpx_mock.add_response(json={"v": 3})
+        await api_manager._make_request("/api/test")
+        await api_manager._make_request("/api/test")
+        third = await api_manager._make_request("/api/test")
+        assert "If-None-Match" not in httpx_mock.get_requests()[2].headers
+        assert third == {"v": 3}
+
+
 class TestGetLastVulnerabilities:
     """Test get_last_vulnerabilities method."""
 
@@ -113,6 +384,15 @@ class TestGetLastVulnerabilities:
         assert result1 is result2
         assert len(httpx_mock.get_requests()) == 1
 
+    async def test_get_last_vulnerabilities_matches_validated_model(
+        self, api_manager, httpx_mock, sample_vulnerabilities_list
+    ):
+        """Test that the adapter-built model equals a fully validated one."""
+        httpx_mock.add_response(json=sample_vulnerabilities_list)
+        result = await api_manager.get_last_vulnerabilities()
+        expected = ExploitedVulnerabilities(list=sample_vulnerabilities_list)
+        assert result.model_dump() == expected.model_dump()
+
     async def test_get_last_vulnerabilities_cache_miss_after_expiry(
         self, httpx_mock, sample_vulnerabilities_list
     ):
@@ -199,71 +479,285 @@ class TestSearchVulnerabilities:
         assert isinstance(result, SearchResponse)
         assert result.total_elements == 100
 
-    async def test_search_vulnerabilities_with_score_filter(
-        self, api_manager, httpx_mock, sample_search_response
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {"from_score": 7.5, "to_score": 10},
+                {"fromScore": "7.5", "toScore": "10"},
+            ),
+            ({"from_epss": 50, "to_epss": 100}, {"fromEpss": "50", "toEpss": "100"}),
+            (
+                {"from_date": "2024-01-01", "to_date": "2024-12-31"},
+                {"fromDate": "2024-01-01", "toDate": "2024-12-31"},
+            ),
+            ({"text": "Windows"}, {"text": "Windows"}),
+            ({"exploited": True}, {"exploited": "true"}),
+            ({"page": 1, "size": 20}, {"page": "1", "size": "20"}),
+        ],
+        ids=["score", "epss", "date", "text", "exploited", "pagination"],
+    )
+    async def test_search_vulnerabilities_filters(
+        self, api_manager, httpx_mock, sample_search_response, kwargs, expected
     ):
-        """Test search with CVSS score filters."""
+        """Test that each filter is sent as its EUVD query parameter."""
         httpx_mock.add_response(json=sample_search_response)
-        await api_manager.search_vulnerabilities(from_score=7.5, to_score=10)
-        url = str(httpx_mock.get_requests()[0].url)
-        assert "fromScore=7.5" in url
-        assert "toScore=10" in url
+        await api_manager.search_vulnerabilities(**kwargs)
+        params = httpx_mock.get_requests()[0].url.params
+        assert {key: params[key] for key in expected} == expected
 
-    async def test_search_vulnerabilities_with_epss_filter(
+    async def test_search_vulnerabilities_endpoint(
         self, api_manager, httpx_mock, sample_search_response
     ):
-        """Test search with EPSS score filters."""
+        """Test that correct endpoint is called."""
         httpx_mock.add_response(json=sample_search_response)
-        await api_manager.search_vulnerabilities(from_epss=50, to_epss=100)
-        url = str(httpx_mock.get_requests()[0].url)
-        assert "fromEpss=50" in url
-        assert "toEpss=100" in url
+        await api_manager.search_vulnerabilities()
+        assert "/api/search" in str(httpx_mock.get_requests()[0].url)
 
-    async def test_search_vulnerabilities_with_date_filter(
-        self, api_manager, httpx_mock, sample_search_response
-    ):
-        """Test search with date filters."""
-        httpx_mock.add_response(json=sample_search_response)
-        await api_manager.search_vulnerabilities(
-            from_date="2024-01-01", to_date="2024-12-31"
-        )
-        url = str(httpx_mock.get_requests()[0].url)
-        assert "fromDate=2024-01-01" in url
-        assert "toDate=2024-12-31" in url
+    def test_search_param_map_covers_signature(self):
+        """Test that every search argument has an EUVD query parameter mapping."""
+        signature = inspect.signature(EUVDAPIManager.search_vulnerabilities)
+        arguments = set(signature.parameters) - {"self"}
+        assert {name for name, _, _ in _SEARCH_PARAM_MAP} == arguments
 
-    async def test_search_vulnerabilities_with_text_filter(
+    async def test_search_vulnerabilities_cached(
         self, api_manager, httpx_mock, sample_search_response
     ):
-        """Test search with text/keyword filter."""
+        """Test that an identical search is served from cache."""
         httpx_mock.add_response(json=sample_search_response)
-        await api_manager.search_vulnerabilities(text="Windows")
-        assert "text=Windows" in str(httpx_mock.get_requests()[0].url)
+        r1 = await api_manager.search_vulnerabilities(vendor="Microsoft", page=0)
+        r2 = await api_manager.search_vulnerabilities(page=0, vendor="Microsoft")
+        assert r1 is r2
+        assert len(httpx_mock.get_requests()) == 1
 
-    async def test_search_vulnerabilities_with_exploited_filter(
+    async def test_search_vulnerabilities_cache_keyed_by_params(
         self, api_manager, httpx_mock, sample_search_response
     ):
-        """Test search with exploited status filter."""
+        """Test that searches with different filters are cached separately."""
         httpx_mock.add_response(json=sample_search_response)
-        await api_manager.search_vulnerabilities(exploited=True)
-        assert "exploited=true" in str(httpx_mock.get_requests()[0].url)
-
-    async def test_search_vulnerabilities_with_pagination(
-        self, api_manager, httpx_mock, sample_search_response
-    ):
-        """Test search with pagination."""
         httpx_mock.add_response(json=sample_search_response)
-        await api_manager.search_vulnerabilities(page=1, size=20)
-        url = str(httpx_mock.get_requests()[0].url)
-        assert "page=1" in url
-        assert "size=20" in url
+        await api_manager.search_vulnerabilities(vendor="Microsoft")
+        await api_manager.search_vulnerabilities(vendor="Cisco")
+        assert len(httpx_mock.get_requests()) == 2
 
-    async def test_search_vulnerabilities_endpoint(
-        self, api_manager, httpx_mock, sample_search_response
+
+class TestSearchVulnerabilitiesIter:
+    """Test the on-demand paginated search iterator."""
+
+    async def test_iterates_all_pages(self, api_manager, httpx_mock):
+        """Test that pages are fetched until the last one is yielded."""
+        for page in range(3):
+            httpx_mock.add_response(
+                json={
+                    "content": [{"id": f"EUVD-2024-{page}"}],
+                    "totalElements": 3,
+                    "totalPages": 3,
+                }
+            )
+        ids = [
+            vuln.id
+            async for vuln in api_manager.search_vulnerabilities_iter(
+                page_size=1, vendor="Cisco"
+            )
+        ]
+        assert ids == ["EUVD-2024-0", "EUVD-2024-1", "EUVD-2024-2"]
+        requests = httpx_mock.get_requests()
+        assert [r.url.params["page"] for r in requests] == ["0", "1", "2"]
+        assert all(r.url.params["vendor"] == "Cisco" for r in requests)
+
+    async def test_fetches_lazily(self, api_manager, httpx_mock):
+        """Test that no further page is requested until the consumer asks."""
+        httpx_mock.add_response(
+            json={"content": [{"id": "EUVD-2024-0"}], "totalPages": 5}
+        )
+        iterator = api_manager.search_vulnerabilities_iter(page_size=1)
+        assert (await anext(iterator)).id == "EUVD-2024-0"
+        await iterator.aclose()
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_pages_not_cached(self, api_manager, httpx_mock):
+        """Test that iterated pages stay out of the response and ETag caches."""
+        for page in range(3):
+            httpx_mock.add_response(
+                json={"content": [{"id": f"EUVD-2024-{page}"}], "totalPages": 3},
+                headers={"ETag": f'"page-{page}"'},
+            )
+        results = [
+            v async for v in api_manager.search_vulnerabilities_iter(page_size=1)
+        ]
+        assert len(results) == 3
+        assert not api_manager._cache
+        assert not api_manager._etags
+
+    async def test_rejects_unknown_filter(self, api_manager):
+        """Test that a misspelt filter fails instead of being ignored."""
+        with pytest.raises(TypeError, match="vednor"):
+            await anext(api_manager.search_vulnerabilities_iter(vednor="Cisco"))
+        with pytest.raises(TypeError, match="page"):
+            await anext(api_manager.search_vulnerabilities_iter(page=2))
+
+    @pytest.mark.parametrize("page_size", [0, -1, 101])
+    async def test_rejects_out_of_range_page_size(self, api_manager, page_size):
+        """Test that page sizes outside 1-100 fail before any request."""
+        with pytest.raises(ValueError, match="page_size"):
+            await anext(api_manager.search_vulnerabilities_iter(page_size=page_size))
+
+    async def test_stops_on_empty_page(self, api_manager, httpx_mock):
+        """Test that an empty page ends iteration without totals."""
+        httpx_mock.add_response(json={"content": []})
+        results = [v async for v in api_manager.search_vulnerabilities_iter()]
+        assert results == []
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestEndpointUrls:
+    """Test the precomputed endpoint URLs."""
+
+    def test_known_endpoints_precomputed(self, api_manager):
+        """Test that every known endpoint has a full URL."""
+        assert set(api_manager._urls) == set(_ENDPOINTS)
+        assert api_manager._urls["/api/search"] == SEARCH_URL
+
+    async def test_unknown_endpoint_falls_back(self, api_manager, httpx_mock):
+        """Test that endpoints outside the table are still joined to the base URL."""
+        httpx_mock.add_response(url=f"{settings.euvd_base_url}/api/other", json={})
+        assert await api_manager._make_request("/api/other") == {}
+
+
+class TestParseSearchResponse:
+    """Test the _parse_search_response helper."""
+
+    def test_content_is_validated(self, sample_search_response):
+        """Test that result items become Vulnerability instances."""
+        result = _parse_search_response(sample_search_response)
+        assert all(isinstance(v, Vulnerability) for v in result)
+        assert result.total_elements == sample_search_response["totalElements"]
+
+    def test_alternative_list_field(self, sample_search_response):
+        """Test that results under 'data' are validated too."""
+        body = {"data": sample_search_response["content"], "total": 1}
+        result = _parse_search_response(body)
+        assert isinstance(result.content[0], Vulnerability)
+
+    def test_only_content_validated(self, sample_search_response):
+        """Test that leftover alternative lists are not validated next to content."""
+        leftover = [{"id": 5}]
+        body = {**sample_search_response, "data": leftover}
+        result = _parse_search_response(body)
+        assert all(isinstance(v, Vulnerability) for v in result)
+        assert result.model_extra["data"] == leftover
+
+    def test_empty_content_uses_alternative(self, sample_search_response):
+        """Test that an empty content list does not hide results under 'data'."""
+        body = {"content": [], "data": sample_search_response["content"]}
+        result = _parse_search_response(body)
+        assert len(result) == len(sample_search_response["content"])
+
+    def test_input_not_mutated(self, sample_search_response):
+        """Test that the shared response body is left untouched."""
+        before = copy.deepcopy(sample_search_response)
+        _parse_search_response(sample_search_response)
+        assert sample_search_response == before
+
+
+class TestTrustResponse:
+    """Test the trust_response fast path."""
+
+    def test_disabled_by_default(self, api_manager):
+        """Test that responses are validated unless trust is opted into."""
+        assert api_manager._trust_response is False
+
+    def test_build_vulnerabilities_trusted_skips_validation(self):
+        """Test that trusted items are constructed without type checks."""
+        vulns = _build_vulnerabilities([{"id": "x", "baseScore": "n/a"}], trusted=True)
+        assert isinstance(vulns[0], Vulnerability)
+        assert vulns[0].base_score == "n/a"
+
+    def test_trusted_nested_records_dump_cleanly(self, sample_vulnerability):
+        """Test that nested records are models, so dumping emits no warnings."""
+        item = {
+            **sample_vulnerability,
+            "enisaIdProduct": [
+                {
+                    "id": "p-1",
+                    "product": {"name": "IOS XE"},
+                    "product_version": "17.9",
+                }
+            ],
+            "enisaIdVendor": [{"id": "v-1", "vendor": {"name": "Cisco"}}],
+        }
+        vuln = _build_vulnerabilities([item], trusted=True)[0]
+        assert isinstance(vuln.enisa_id_product[0], EnisaIdProduct)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            dumped = vuln.model_dump(mode="json")
+        assert dumped == Vulnerability.model_validate(item).model_dump(mode="json")
+        assert dumped["enisa_id_product"][0]["product"] == {"name": "IOS XE"}
+
+    async def test_trusted_search_builds_models(
+        self, httpx_mock, sample_search_response
     ):
-        """Test that correct endpoint is called."""
+        """Test that a trusting manager still returns Vulnerability instances."""
         httpx_mock.add_response(json=sample_search_response)
-        await api_manager.search_vulnerabilities()
-        assert "/api/search" in str(httpx_mock.get_requests()[0].url)
+        manager = EUVDAPIManager(max_retries=0, trust_response=True)
+        result = await manager.search_vulnerabilities()
+        assert [v.id for v in result] == ["EUVD-2024-45012", "EUVD-2024-45013"]
+        assert all(isinstance(v, Vulnerability) for v in result)
+        await manager.close()
+
+
+class TestCacheKey:
+    """Test the _cache_key helper."""
+
+    def test_no_params(self):
+        """Test that an endpoint without parameters is its own key."""
+        assert _cache_key("/api/lastvulnerabilities") == "/api/lastvulnerabilities"
+
+    def test_param_order_is_irrelevant(self):
+        """Test that parameter order does not change the key."""
+        assert _cache_key("/api/search", {"a": 1, "b": 2}) == _cache_key(
+            "/api/search", {"b": 2, "a": 1}
+        )
+
+    def test_distinct_endpoints(self):
+        """Test that identical parameters on different endpoints do not collide."""
+        assert _cache_key("/api/enisaid", {"id": "x"}) != _cache_key(
+            "/api/advisory", {"id": "x"}
+        )
+
+
+class TestSearchVulnerabilitiesPages:
+    """Test search_vulnerabilities_pages method."""
+
+    async def test_fetches_every_page(self, api_manager, httpx_mock):
+        """Test that one request is made per page with the shared filters."""
+        for page in range(3):
+            httpx_mock.add_response(
+                url=SEARCH_URL,
+                match_params={"vendor": "Microsoft", "page": str(page)},
+                json={"content": [{"id": f"EUVD-2024-{page}"}], "page": page},
+            )
+        results = await api_manager.search_vulnerabilities_pages(
+            pages=range(3), vendor="Microsoft"
+        )
+        assert len(httpx_mock.get_requests()) == 3
+        assert [r.page for r in results] == [0, 1, 2]
+
+    async def test_preserves_page_order(self, api_manager, httpx_mock):
+        """Test that responses are returned in the order of the requested pages."""
+        for page in (2, 1):
+            httpx_mock.add_response(
+                url=SEARCH_URL,
+                match_params={"page": str(page)},
+                json={"content": [{"id": f"EUVD-2024-{page}"}], "page": page},
+            )
+        results = await api_manager.search_vulnerabilities_pages(pages=range(1, 3))
+        assert [r.content[0].id for r in results] == ["EUVD-2024-1", "EUVD-2024-2"]
+
+    async def test_empty_range(self, api_manager, httpx_mock):
+        """Test that an empty range makes no requests."""
+        assert await api_manager.search_vulnerabilities_pages(pages=range(0)) == []
+        assert len(httpx_mock.get_requests()) == 0
 
 
 class TestGetVulnerabilityById:
@@ -294,6 +788,27 @@ class TestGetVulnerabilityById:
         with pytest.raises(httpx.HTTPStatusError):
             await api_manager.get_vulnerability_by_id("EUVD-9999-99999")
 
+    async def test_get_vulnerability_by_id_cached(
+        self, api_manager, httpx_mock, sample_vulnerability
+    ):
+        """Test that a repeated lookup returns the cached model without a request."""
+        httpx_mock.add_response(json=sample_vulnerability)
+        r1 = await api_manager.get_vulnerability_by_id("EUVD-2024-45012")
+        r2 = await api_manager.get_vulnerability_by_id("EUVD-2024-45012")
+        assert r1 is r2
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_get_vulnerability_by_id_error_not_cached(
+        self, api_manager, httpx_mock, sample_vulnerability
+    ):
+        """Test that a failed lookup is retried on the next call."""
+        httpx_mock.add_response(status_code=404)
+        httpx_mock.add_response(json=sample_vulnerability)
+        with pytest.raises(httpx.HTTPStatusError):
+            await api_manager.get_vulnerability_by_id("EUVD-2024-45012")
+        result = await api_manager.get_vulnerability_by_id("EUVD-2024-45012")
+        assert result.id == "EUVD-2024-45012"
+
 
 class TestGetAdvisoryById:
     """Test get_advisory_by_id method."""
@@ -317,6 +832,16 @@ class TestGetAdvisoryById:
         assert "/api/advisory" in url
         assert "id=test-advisory-001" in url
 
+    async def test_get_advisory_by_id_cached(
+        self, api_manager, httpx_mock, sample_advisory
+    ):
+        """Test that a repeated lookup returns the cached model without a request."""
+        httpx_mock.add_response(json=sample_advisory)
+        r1 = await api_manager.get_advisory_by_id("cisco-sa-ata19x-multi-RDTEqRsy")
+        r2 = await api_manager.get_advisory_by_id("cisco-sa-ata19x-multi-RDTEqRsy")
+        assert r1 is r2
+        assert len(httpx_mock.get_requests()) == 1
+
 
 class TestAsyncContextManager:
     """Test EUVDAPIManager as an async context manager."""
@@ -329,15 +854,26 @@ class TestAsyncContextManager:
     async def test_context_manager_closes_client(self):
         """Test that client is closed on context manager exit."""
         async with EUVDAPIManager() as manager:
-            _ = manager._get_client()  # force client creation
+            client = manager._get_client()  # force client creation
             assert manager._client is not None
         assert manager._client is None
+        assert client.is_closed
 
     async def test_close_method(self, api_manager):
         """Test close method releases the client."""
-        _ = api_manager._get_client()
+        client = api_manager._get_client()
         await api_manager.close()
         assert api_manager._client is None
+        assert client.is_closed
+
+    async def test_close_clears_caches(self, api_manager, httpx_mock, sample_advisory):
+        """Test that close drops cached lookups so the next call refetches."""
+        httpx_mock.add_response(json=sample_advisory)
+        httpx_mock.add_response(json=sample_advisory)
+        await api_manager.get_advisory_by_id("cisco-sa-ata19x-multi-RDTEqRsy")
+        await api_manager.close()
+        await api_manager.get_advisory_by_id("cisco-sa-ata19x-multi-RDTEqRsy")
+        assert len(httpx_mock.get_requests()) == 2
 
 
 class TestRetryBehavior:
@@ -376,3 +912,41 @@ class TestRetryBehavior:
         with pytest.raises(httpx.TransportError):
             await manager._make_request("/api/test")
         assert len(httpx_mock.get_requests()) == 2
+
+
+class TestRetryDelay:
+    """Test the _retry_delay backoff helper."""
+
+    def test_exponential_with_jitter_bounds(self):
+        """Test that the delay stays within +/-50% of 2**attempt."""
+        for attempt in range(4):
+            delay = _retry_delay(attempt)
+            assert 0.5 * 2**attempt <= delay <= 1.5 * 2**attempt
+
+    def test_jitter_spreads_delays(self, monkeypatch):
+        """Test that the jitter factor is applied to the base delay."""
+        monkeypatch.setattr(
+            "euvd_mcp.controllers.euvd_api.random.uniform", lambda a, b: b
+        )
+        assert _retry_delay(2) == 6.0
+
+    def test_capped_at_backoff_max(self):
+        """Test that large attempts are capped."""
+        assert _retry_delay(20) == settings.euvd_backoff_max
+
+    def test_honours_retry_after(self):
+        """Test that a numeric Retry-After header overrides the backoff."""
+        response = httpx.Response(503, headers={"Retry-After": "7"})
+        assert _retry_delay(0, response) == 7.0
+
+    def test_retry_after_capped(self):
+        """Test that Retry-After is capped at the backoff maximum."""
+        response = httpx.Response(429, headers={"Retry-After": "3600"})
+        assert _retry_delay(0, response) == settings.euvd_backoff_max
+
+    def test_ignores_non_numeric_retry_after(self):
+        """Test that an HTTP-date Retry-After falls back to backoff."""
+        response = httpx.Response(
+            503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+        assert 0.5 <= _retry_delay(0, response) <= 1.5
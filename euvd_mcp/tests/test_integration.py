@@ -4,11 +4,10 @@ Integration tests for EUVD MCP Server.
 These tests verify that different components work together correctly.
 """
 
-import json
-
 import httpx
 import pytest
 
+from euvd_mcp import main
 from euvd_mcp.models import SearchResponse, Vulnerability
 
 
@@ -88,10 +87,9 @@ class TestAPIManagerIntegration:
 class TestDataSerialization:
     """Integration tests for data serialization and deserialization."""
 
-    def test_vulnerability_round_trip(self, sample_vulnerability):
+    def test_vulnerability_round_trip(self, sample_vulnerability, prevalidated_vuln):
         """Test that vulnerability can be serialized and deserialized."""
-        vuln = Vulnerability.model_validate(sample_vulnerability)
-        serialized = vuln.model_dump(mode="json", by_alias=True)
+        serialized = prevalidated_vuln.model_dump(mode="json", by_alias=True)
         assert serialized["id"] == sample_vulnerability["id"]
         assert serialized["baseScore"] == sample_vulnerability["baseScore"]
         assert serialized["description"] == sample_vulnerability["description"]
@@ -104,14 +102,11 @@ class TestDataSerialization:
         assert len(serialized["content"]) == 2
         assert serialized["totalElements"] == 100
 
-    def test_json_compatibility(self, sample_vulnerability):
+    def test_json_compatibility(self, prevalidated_vuln):
         """Test that serialized data is JSON-compatible."""
-        vuln = Vulnerability.model_validate(sample_vulnerability)
-        serialized = vuln.model_dump(mode="json")
-        json_str = json.dumps(serialized)
-        deserialized = json.loads(json_str)
-        vuln2 = Vulnerability.model_validate(deserialized)
-        assert vuln2.id == vuln.id
+        json_bytes = prevalidated_vuln.model_dump_json(by_alias=True)
+        vuln2 = Vulnerability.model_validate_json(json_bytes)
+        assert vuln2 == prevalidated_vuln
 
 
 @pytest.mark.integration
@@ -225,3 +220,99 @@ class TestComplexScenarios:
         assert detail.id == "EUVD-2024-45012"
         assert detail.description == "Detailed vulnerability information"
         assert detail.base_score == 9.0
+
+
+@pytest.mark.integration
+class TestToolIntegration:
+    """Integration tests for the MCP tool functions in main.py."""
+
+    async def test_get_last_vulnerabilities_tool(
+        self, tool_api, httpx_mock, sample_vulnerabilities_list
+    ):
+        """Test that the tool returns the records with snake_case field names."""
+        httpx_mock.add_response(json=sample_vulnerabilities_list)
+        result = await main.get_last_vulnerabilities()
+        assert result["list"][0]["id"] == "EUVD-2024-45012"
+        assert result["list"][0]["base_score"] == 8.5
+        assert "baseScore" not in result["list"][0]
+
+    async def test_tool_output_keeps_undeclared_fields(self, tool_api, httpx_mock):
+        """Test that upstream fields the models do not declare reach the client."""
+        record = {"id": "EUVD-2024-1", "newUpstreamField": "kept"}
+        httpx_mock.add_response(json=record)
+        httpx_mock.add_response(json={"content": [record], "totalElements": 1})
+        httpx_mock.add_response(json=[record])
+
+        detail = await main.get_vulnerability_by_id("EUVD-2024-1")
+        search = await main.search_vulnerabilities(text="kept")
+        latest = await main.get_last_vulnerabilities()
+
+        assert detail["newUpstreamField"] == "kept"
+        assert search["content"][0]["newUpstreamField"] == "kept"
+        assert latest["list"][0]["newUpstreamField"] == "kept"
+
+    async def test_get_vulnerability_by_id_tool_rejects_bad_id(
+        self, tool_api, httpx_mock
+    ):
+        """Test that invalid input is reported without calling the API."""
+        result = await main.get_vulnerability_by_id("CVE-2024-12345")
+        assert result["error"] == "validation_error"
+        assert len(httpx_mock.get_requests()) == 0
+
+    async def test_get_advisory_by_id_tool_http_error(self, tool_api, httpx_mock):
+        """Test that upstream HTTP errors are mapped to a structured error."""
+        httpx_mock.add_response(status_code=404)
+        result = await main.get_advisory_by_id("missing-advisory")
+        assert result["error"] == "http_error"
+        assert result["status_code"] == 404
+
+    async def test_search_vulnerabilities_bulk_tool_merges_pages(
+        self, tool_api, httpx_mock
+    ):
+        """Test that the bulk tool merges records from every requested page."""
+        for page in range(2):
+            httpx_mock.add_response(
+                json={
+                    "content": [{"id": f"EUVD-2024-{page}"}],
+                    "totalElements": 2,
+                    "totalPages": 2,
+                }
+            )
+        result = await main.search_vulnerabilities_bulk(from_page=0, to_page=1, size=1)
+        assert sorted(v["id"] for v in result["content"]) == [
+            "EUVD-2024-0",
+            "EUVD-2024-1",
+        ]
+        assert result["total_elements"] == 2
+
+    async def test_search_vulnerabilities_cursor_tool_walks_pages(
+        self, tool_api, httpx_mock
+    ):
+        """Test that next_cursor fetches the following page with the same filters."""
+        for page in range(2):
+            httpx_mock.add_response(
+                json={
+                    "content": [{"id": f"EUVD-2024-{page}"}],
+                    "totalElements": 2,
+                    "totalPages": 2,
+                }
+            )
+        first = await main.search_vulnerabilities_cursor(vendor="Microsoft", size=1)
+        assert first["content"][0]["id"] == "EUVD-2024-0"
+        assert first["next_cursor"] is not None
+
+        second = await main.search_vulnerabilities_cursor(cursor=first["next_cursor"])
+        assert second["content"][0]["id"] == "EUVD-2024-1"
+        assert second["next_cursor"] is None
+
+        params = httpx_mock.get_requests()[1].url.params
+        assert params["vendor"] == "Microsoft"
+        assert params["page"] == "1"
+
+    async def test_search_vulnerabilities_cursor_tool_rejects_bad_cursor(
+        self, tool_api, httpx_mock
+    ):
+        """Test that a malformed cursor is reported as a validation error."""
+        result = await main.search_vulnerabilities_cursor(cursor="garbage!")
+        assert result["error"] == "validation_error"
+        assert len(httpx_mock.get_requests()) == 0
@@ -2,12 +2,19 @@
 Unit tests for Pydantic models.
 """
 
+import math
+
+import pytest
+
 from euvd_mcp.models import (
+    VULNERABILITY_LIST_ADAPTER,
     Advisory,
     ExploitedVulnerabilities,
     SearchResponse,
     Vulnerability,
     VulnerabilityListResponse,
+    to_json_bytes,
+    validate_many,
 )
 
 
@@ -29,13 +36,18 @@ class TestVulnerabilityModel:
         assert vuln.base_score is None
         assert vuln.description is None
 
-    def test_vulnerability_json_serialization(self, sample_vulnerability):
+    def test_vulnerability_json_serialization(self, prevalidated_vuln):
         """Test serializing Vulnerability to JSON."""
-        vuln = Vulnerability.model_validate(sample_vulnerability)
-        json_data = vuln.model_dump(mode="json", by_alias=True)
+        json_data = prevalidated_vuln.model_dump(by_alias=True)
         assert json_data["id"] == "EUVD-2024-45012"
         assert json_data["baseScore"] == 8.5
 
+    def test_to_json_bytes(self, prevalidated_vuln):
+        """Test that to_json_bytes writes the model straight to JSON bytes."""
+        raw = to_json_bytes(prevalidated_vuln, by_alias=True)
+        assert isinstance(raw, bytes)
+        assert raw == prevalidated_vuln.model_dump_json(by_alias=True).encode()
+
     def test_vulnerability_alias_fields(self, sample_vulnerability):
         """Test that field aliases work correctly."""
         vuln = Vulnerability.model_validate(sample_vulnerability)
@@ -45,14 +57,26 @@ class TestVulnerabilityModel:
 
     def test_vulnerability_extra_fields_allowed(self, sample_vulnerability):
         """Test that extra fields are allowed and preserved."""
-        sample_vulnerability["custom_field"] = "custom_value"
-        vuln = Vulnerability.model_validate(sample_vulnerability)
+        data = {**sample_vulnerability, "custom_field": "custom_value"}
+        vuln = Vulnerability.model_validate(data)
         assert vuln.id == "EUVD-2024-45012"
 
 
 class TestVulnerabilityListResponse:
     """Test the VulnerabilityListResponse model."""
 
+    def test_validate_many(self, sample_vulnerabilities_list):
+        """Test that validate_many returns a plain list of models."""
+        vulns = validate_many(sample_vulnerabilities_list)
+        assert [v.id for v in vulns] == ["EUVD-2024-45012", "EUVD-2024-45013"]
+        assert all(isinstance(v, Vulnerability) for v in vulns)
+
+    def test_list_adapter_matches_root_model(self, sample_vulnerabilities_list):
+        """Test that the shared adapter builds the same models as the RootModel."""
+        vulns = VULNERABILITY_LIST_ADAPTER.validate_python(sample_vulnerabilities_list)
+        expected = VulnerabilityListResponse.model_validate(sample_vulnerabilities_list)
+        assert vulns == expected.root
+
     def test_vulnerability_list_creation(self, sample_vulnerabilities_list):
         """Test creating a VulnerabilityListResponse."""
         response = VulnerabilityListResponse.model_validate(sample_vulnerabilities_list)
@@ -95,12 +119,19 @@ class TestExploitedVulnerabilities:
         assert len(response.list) == 2
         assert response.list[0].id == "EUVD-2024-45012"
 
+    def test_from_trusted_matches_validated(self, sample_vulnerabilities_list):
+        """Test that from_trusted equals the validated model for valid input."""
+        vulns = validate_many(sample_vulnerabilities_list)
+        trusted = ExploitedVulnerabilities.from_trusted(vulns)
+        assert trusted == ExploitedVulnerabilities(list=sample_vulnerabilities_list)
+        assert trusted.list is vulns
+
     def test_exploited_vulnerabilities_json_serialization(
         self, sample_vulnerabilities_list
     ):
         """Test serializing ExploitedVulnerabilities to JSON."""
         response = ExploitedVulnerabilities(list=sample_vulnerabilities_list)
-        json_data = response.model_dump(mode="json")
+        json_data = response.model_dump()
         assert "list" in json_data
         assert len(json_data["list"]) == 2
 
@@ -141,6 +172,19 @@ class TestSearchResponse:
         response = SearchResponse.model_validate(data_response)
         assert len(response) == 2
 
+    @pytest.mark.parametrize("content", [{}, {"content": None}, {"content": []}])
+    @pytest.mark.parametrize("key", ["data", "vulnerabilities"])
+    def test_alternative_field_names_normalized(
+        self, sample_search_response, key, content
+    ):
+        """Test that each alternative list key and 'total' fill a missing or empty content."""
+        body = {**content, key: sample_search_response["content"], "total": 7}
+        response = SearchResponse.model_validate(body)
+        assert len(response.content) == 2
+        assert key not in response.model_extra
+        assert response.total_elements == 7
+        assert key in body and body.get("content") == content.get("content")
+
     def test_search_response_no_results(self):
         """Test SearchResponse with no results."""
         data = {
@@ -154,6 +198,50 @@ class TestSearchResponse:
         assert len(response) == 0
         assert response.total_elements == 0
 
+    def test_from_trusted_matches_validated(self, sample_search_response):
+        """Test that from_trusted accepts API aliases and skips validation."""
+        content = validate_many(sample_search_response["content"])
+        trusted = SearchResponse.from_trusted(
+            {**sample_search_response, "content": content}
+        )
+        assert trusted == SearchResponse.model_validate(sample_search_response)
+        assert trusted.total_elements == 100
+
+    def test_content_is_tuple(self, sample_search_response):
+        """Test that result pages are stored as tuples."""
+        response = SearchResponse.model_validate(sample_search_response)
+        assert isinstance(response.content, tuple)
+        assert response.model_dump()["content"][0]["id"] == "EUVD-2024-45012"
+
+    def test_to_arrays(self, sample_search_response):
+        """Test the column view of a result page."""
+        content = [*sample_search_response["content"], {"id": "EUVD-2024-1"}]
+        columns = SearchResponse.model_validate({"content": content}).to_arrays()
+        assert columns["id"] == ["EUVD-2024-45012", "EUVD-2024-45013", "EUVD-2024-1"]
+        assert list(columns["base_score"])[:2] == [8.5, 8.5]
+        assert math.isnan(columns["epss"][2])
+        assert columns["base_score"].typecode == "d"
+
+    def test_has_next_page_from_total_pages(self):
+        """Test that totalPages decides whether another page exists."""
+        response = SearchResponse.model_validate({"content": [], "totalPages": 2})
+        assert response.has_next_page(0, 10) is True
+        assert response.has_next_page(1, 10) is False
+
+    def test_has_next_page_from_total_elements(self):
+        """Test the fallback to totalElements when totalPages is absent."""
+        response = SearchResponse.model_validate({"content": [], "totalElements": 15})
+        assert response.has_next_page(0, 10) is True
+        assert response.has_next_page(1, 10) is False
+
+    def test_has_next_page_without_totals(self, sample_search_response):
+        """Test that a full page without totals suggests more results."""
+        response = SearchResponse.model_validate(
+            {"content": sample_search_response["content"]}
+        )
+        assert response.has_next_page(0, 2) is True
+        assert response.has_next_page(0, 10) is False
+
 
 class TestAdvisoryModel:
     """Test the Advisory model."""
@@ -176,7 +264,7 @@ class TestAdvisoryModel:
     def test_advisory_json_serialization(self, sample_advisory):
         """Test serializing Advisory to JSON."""
         advisory = Advisory.model_validate(sample_advisory)
-        json_data = advisory.model_dump(mode="json", by_alias=True)
+        json_data = advisory.model_dump(by_alias=True)
         assert json_data["id"] == "cisco-sa-ata19x-multi-RDTEqRsy"
         assert json_data["baseScore"] == 7.5
 
@@ -2,82 +2,137 @@
 Unit tests for application settings.
 """
 
-from unittest.mock import patch
+import importlib.util
 
-from euvd_mcp.utils.settings import Settings
+import pytest
+
+import euvd_mcp.utils.settings as settings_module
+from euvd_mcp.utils.settings import DEFAULT_USER_AGENT, Settings, get_settings
+
+
+@pytest.fixture(scope="module")
+def default_settings():
+    """Return one defaults-only Settings shared by the default-value tests."""
+    return Settings(_env_file=None)
 
 
 class TestSettingsDefaults:
     """Test default settings (env file bypassed to test coded defaults)."""
 
-    def test_default_host(self):
+    def test_default_host(self, default_settings):
         """Test default host setting."""
-        settings = Settings(_env_file=None)
-        assert settings.host == "127.0.0.1"
+        assert default_settings.host == "127.0.0.1"
 
-    def test_default_port(self):
+    def test_default_port(self, default_settings):
         """Test default port setting."""
-        settings = Settings(_env_file=None)
-        assert settings.port == 8000
+        assert default_settings.port == 8000
 
-    def test_default_euvd_base_url(self):
+    def test_default_euvd_base_url(self, default_settings):
         """Test default EUVD base URL."""
-        settings = Settings(_env_file=None)
-        assert settings.euvd_base_url == "https://euvdservices.enisa.europa.eu"
+        assert default_settings.euvd_base_url == "https://euvdservices.enisa.europa.eu"
 
-    def test_default_euvd_timeout(self):
+    def test_default_euvd_timeout(self, default_settings):
         """Test default EUVD timeout."""
-        settings = Settings(_env_file=None)
-        assert settings.euvd_timeout == 30
+        assert default_settings.euvd_timeout == 30
 
-    def test_default_euvd_max_retries(self):
+    def test_default_euvd_max_retries(self, default_settings):
         """Test default EUVD max retries."""
-        settings = Settings(_env_file=None)
-        assert settings.euvd_max_retries == 3
+        assert default_settings.euvd_max_retries == 3
 
-    def test_user_agent_set(self):
+    def test_user_agent_set(self, default_settings):
         """Test that user agent is set."""
-        settings = Settings(_env_file=None)
-        assert settings.user_agent is not None
-        assert len(settings.user_agent) > 0
+        assert default_settings.user_agent is not None
+        assert len(default_settings.user_agent) > 0
+
+    def test_default_user_agent_shared(self, default_settings):
+        """Test that instances share the module-level default user agent."""
+        assert default_settings.user_agent is DEFAULT_USER_AGENT
+        assert Settings(_env_file=None).user_agent is default_settings.user_agent
 
-    def test_default_cache_ttl(self):
+    def test_default_cache_ttl(self, default_settings):
         """Test default cache TTL."""
-        settings = Settings(_env_file=None)
-        assert settings.cache_ttl == 30
+        assert default_settings.cache_ttl == 30
+
+    def test_default_http2_enabled(self, default_settings):
+        """Test that HTTP/2 is enabled by default."""
+        assert default_settings.euvd_http2 is True
+
+    def test_default_connection_pool(self, default_settings):
+        """Test default connection pool limits."""
+        assert default_settings.euvd_max_connections == 32
+        assert default_settings.euvd_max_keepalive_connections == 16
+        assert default_settings.euvd_keepalive_expiry == 75.0
 
-    def test_default_log_level(self):
+    def test_default_log_level(self, default_settings):
         """Test default log level."""
-        settings = Settings(_env_file=None)
-        assert settings.log_level == "INFO"
+        assert default_settings.log_level == "INFO"
 
 
 class TestSettingsEnvironmentVariables:
     """Test settings loading from environment variables."""
 
-    def test_host_from_env(self):
-        """Test loading host from environment variable."""
-        with patch.dict("os.environ", {"host": "0.0.0.0"}):
-            settings = Settings()
-            assert settings.host == "0.0.0.0"
+    @pytest.mark.parametrize(
+        ("env_var", "value", "attr", "expected"),
+        [
+            ("host", "0.0.0.0", "host", "0.0.0.0"),
+            ("port", "9000", "port", 9000),
+            ("euvd_timeout", "60", "euvd_timeout", 60),
+            ("euvd_max_retries", "5", "euvd_max_retries", 5),
+        ],
+    )
+    def test_value_from_env(self, monkeypatch, env_var, value, attr, expected):
+        """Test loading a setting from its environment variable."""
+        monkeypatch.setenv(env_var, value)
+        settings = Settings(_env_file=None)
+        assert getattr(settings, attr) == expected
+
+
+class TestSettingsEnvFile:
+    """Test settings loading from a .env file."""
+
+    def test_unknown_keys_ignored(self, tmp_path):
+        """Test that unrelated .env entries do not fail settings loading."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("PORT=9100\nSOME_OTHER_TOOL_TOKEN=abc\n")
+        settings = Settings(_env_file=env_file)
+        assert settings.port == 9100
+        assert not hasattr(settings, "some_other_tool_token")
+
+
+class TestGetSettings:
+    """Test the cached settings factory."""
 
-    def test_port_from_env(self):
-        """Test loading port from environment variable."""
-        with patch.dict("os.environ", {"port": "9000"}):
-            settings = Settings()
-            assert settings.port == 9000
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        """Isolate each test from the process-wide cached instance."""
+        get_settings.cache_clear()
+        yield
+        get_settings.cache_clear()
 
-    def test_timeout_from_env(self):
-        """Test loading timeout from environment variable."""
-        with patch.dict("os.environ", {"euvd_timeout": "60"}):
-            settings = Settings()
-            assert settings.euvd_timeout == 60
+    def test_returns_cached_instance(self):
+        """Test that repeated calls reuse one Settings instance."""
+        assert get_settings() is get_settings()
 
-    def test_max_retries_from_env(self):
-        """Test loading max retries from environment variable."""
-        with patch.dict("os.environ", {"euvd_max_retries": "5"}):
-            settings = Settings()
-            assert settings.euvd_max_retries == 5
+    def test_cache_clear_rereads_environment(self, monkeypatch):
+        """Test that clearing the cache picks up environment changes."""
+        monkeypatch.setenv("port", "9001")
+        get_settings.cache_clear()
+        assert get_settings().port == 9001
+
+
+class TestSettingsSingleton:
+    """Test the module-level settings instance."""
+
+    def test_module_singleton_comes_from_factory(self):
+        """Test that the module-level settings is the instance get_settings() caches."""
+        # A private copy of the module, so other tests' cache_clear() cannot interfere
+        spec = importlib.util.spec_from_file_location(
+            "settings_copy", settings_module.__file__
+        )
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        assert module.settings is module.get_settings()
 
 
 class TestSettingsValidation:
@@ -86,6 +141,7 @@ class TestSettingsValidation:
     def test_valid_settings(self):
         """Test creating valid settings."""
         settings = Settings(
+            _env_file=None,
             host="localhost",
             port=8080,
             euvd_base_url="https://api.example.com",
@@ -99,12 +155,12 @@ class TestSettingsValidation:
 
     def test_settings_are_immutable(self):
         """Test that settings instance is created correctly."""
-        settings = Settings()
+        settings = Settings(_env_file=None)
         # Settings should be configurable
         assert hasattr(settings, "host")
         assert hasattr(settings, "port")
 
     def test_url_format(self):
         """Test that base URL is properly formatted."""
-        settings = Settings()
+        settings = Settings(_env_file=None)
         assert settings.euvd_base_url.startswith("https://")
@@ -2,14 +2,20 @@
 Unit tests for Pydantic input models in models/input_models.py.
 """
 
+import base64
+
 import pytest
 from pydantic import ValidationError
 
 from euvd_mcp.models import (
     GetAdvisoryByIdInput,
     GetVulnerabilityByIdInput,
+    PageRangeInput,
+    SearchCursor,
+    SearchCursorInput,
     SearchVulnerabilitiesInput,
 )
+from euvd_mcp.models.input_models import MAX_BULK_PAGES
 
 
 class TestSearchVulnerabilitiesInputScores:
@@ -121,6 +127,54 @@ class TestSearchVulnerabilitiesInputAllNone:
         assert "to_score" not in dumped
 
 
+class TestPageRangeInput:
+    """Tests for PageRangeInput."""
+
+    def test_single_page(self):
+        m = PageRangeInput(from_page=0, to_page=0)
+        assert m.pages == range(0, 1)
+
+    def test_max_span(self):
+        m = PageRangeInput(from_page=5, to_page=5 + MAX_BULK_PAGES - 1)
+        assert len(m.pages) == MAX_BULK_PAGES
+
+    def test_span_above_max(self):
+        with pytest.raises(ValidationError, match="at most"):
+            PageRangeInput(from_page=0, to_page=MAX_BULK_PAGES)
+
+    def test_reversed_range(self):
+        with pytest.raises(ValidationError, match="to_page must be >= from_page"):
+            PageRangeInput(from_page=3, to_page=2)
+
+    def test_negative_page(self):
+        with pytest.raises(ValidationError, match="greater than or equal to 0"):
+            PageRangeInput(from_page=-1, to_page=0)
+
+
+class TestSearchCursor:
+    """Tests for SearchCursor and SearchCursorInput."""
+
+    def test_round_trip(self):
+        cursor = SearchCursor(
+            filters=SearchVulnerabilitiesInput(vendor="Microsoft", size=50), page=3
+        )
+        decoded = SearchCursorInput(cursor=cursor.encode()).cursor
+        assert decoded == cursor
+
+    def test_none_cursor(self):
+        assert SearchCursorInput(cursor=None).cursor is None
+
+    def test_malformed_cursor(self):
+        with pytest.raises(ValidationError, match="cursor is malformed"):
+            SearchCursorInput(cursor="not a cursor!")
+
+    def test_tampered_filters_rejected(self):
+        payload = b'{"filters": {"size": 500}, "page": 0}'
+        tampered = base64.urlsafe_b64encode(payload).decode()
+        with pytest.raises(ValidationError, match="less than or equal to 100"):
+            SearchCursorInput(cursor=tampered)
+
+
 class TestGetVulnerabilityByIdInput:
     """Tests for GetVulnerabilityByIdInput."""
 
@@ -4,12 +4,16 @@ Application settings using Pydantic Settings.
 Loads configuration from environment variables and .env file.
 """
 
+import functools
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _ENV_FILE = Path(__file__).parent.parent.parent / ".env"
 
+# Sent to the EUVD API unless USER_AGENT overrides it
+DEFAULT_USER_AGENT = "euvd-mcp-tool"
+
 
 class Settings(BaseSettings):
     """Application configuration settings."""
@@ -24,24 +28,48 @@ class Settings(BaseSettings):
     euvd_base_url: str = "https://euvdservices.enisa.europa.eu"
     euvd_timeout: int = 30
     euvd_max_retries: int = 3
+    # Upper bound in seconds on a single retry delay (backoff or Retry-After)
+    euvd_backoff_max: float = 30.0
+    # Negotiate HTTP/2 so concurrent tool calls multiplex over one connection
+    euvd_http2: bool = True
+    # Connection pool limits for the shared HTTP client (all calls hit one host)
+    euvd_max_connections: int = 32
+    euvd_max_keepalive_connections: int = 16
+    # Seconds an idle keep-alive connection stays in the pool
+    euvd_keepalive_expiry: float = 75.0
 
-    # Cache TTL in seconds for the latest/exploited/critical endpoints
+    # Cache TTL in seconds for the latest/exploited/critical and search endpoints
     cache_ttl: int = 30
     # Maximum number of entries in the response cache
     cache_max_size: int = 128
+    # TTL in seconds and size of the per-ID vulnerability/advisory caches
+    detail_cache_ttl: int = 3600
+    detail_cache_max_size: int = 4096
 
     # Logging level (DEBUG, INFO, WARNING, ERROR)
     log_level: str = "INFO"
 
     # User Agent for API Requests
-    user_agent: str = "euvd-mcp-tool"
+    user_agent: str = DEFAULT_USER_AGENT
 
     model_config = SettingsConfigDict(
         env_file=_ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
+        # Tolerate .env entries meant for other tools (e.g. docker-compose)
+        extra="ignore",
     )
 
 
+@functools.cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment only once.
+
+    Call ``get_settings.cache_clear()`` after changing the environment to
+    have the next call re-read it.
+    """
+    return Settings()
+
+
 # Create a singleton instance
-settings = Settings()
+settings = get_settings()